@@ -1,11 +1,12 @@
 """View Assist custom integration."""
 
+from collections.abc import Mapping
 import logging
 
 from homeassistant import config_entries
 from homeassistant.const import CONF_TYPE, Platform
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers import discovery_flow
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers import device_registry as dr, discovery_flow
 from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers.start import async_at_started
 
@@ -36,8 +37,10 @@ from .const import (
     CONF_USE_24H_TIME,
     CONF_USE_ANNOUNCE,
     DEFAULT_VALUES,
+    DISPLAY_DEVICES_CACHE,
     DOMAIN,
     OPTION_KEY_MIGRATIONS,
+    SUGGESTED_VALUES_CACHE,
 )
 from .entity_listeners import EntityListeners
 from .helpers import (
@@ -98,8 +101,10 @@ async def async_migrate_entry(
     if entry.minor_version < 2 and entry.options:
         # Migrate options keys
         for key, value in new_options.items():
-            if isinstance(value, str) and value in OPTION_KEY_MIGRATIONS:
-                new_options[key] = OPTION_KEY_MIGRATIONS.get(value)
+            if isinstance(value, str) and (
+                migrated := OPTION_KEY_MIGRATIONS.get(value)
+            ):
+                new_options[key] = migrated
 
     if entry.minor_version < 3 and entry.options:
         # Remove mic_type key
@@ -280,6 +285,19 @@ async def load_common_functions(hass: HomeAssistant, entry: VAConfigEntry):
 
     setup_va_templates(hass)
 
+    # Clear cached display devices for config flows when device registry changes
+    @callback
+    def _async_clear_display_devices_cache(event: Event) -> None:
+        hass.data[DOMAIN][DISPLAY_DEVICES_CACHE] = None
+
+    hass.data[DOMAIN][DISPLAY_DEVICES_CACHE] = None
+    entry.async_on_unload(
+        hass.bus.async_listen(
+            dr.EVENT_DEVICE_REGISTRY_UPDATED, _async_clear_display_devices_cache
+        )
+    )
+    entry.async_on_unload(lambda: hass.data[DOMAIN].pop(DISPLAY_DEVICES_CACHE, None))
+
     # Load asset manager
     am = AssetsManager(hass, entry)
     hass.data[DOMAIN][ASSETS_MANAGER] = am
@@ -326,6 +344,11 @@ def set_runtime_data_for_config(
             value = get_key(attr, dict(master_config_options))
         if value is None or (isinstance(value, dict) and not value):
             value = get_key(attr, DEFAULT_VALUES)
+            # Defaults are read only so copy them for this entry
+            if isinstance(value, Mapping):
+                value = dict(value)
+            elif isinstance(value, tuple):
+                value = list(value)
 
         # This is a fix for config lists being a string
         if isinstance(attr, list):
@@ -437,6 +460,9 @@ async def _async_update_listener(hass: HomeAssistant, config_entry: VAConfigEntr
 async def async_unload_entry(hass: HomeAssistant, entry: VAConfigEntry):
     """Unload a config entry."""
 
+    # Remove cached options form values for this entry
+    hass.data[DOMAIN].get(SUGGESTED_VALUES_CACHE, {}).pop(entry.entry_id, None)
+
     # Unload js resources
     if entry.data[CONF_TYPE] == VAType.MASTER_CONFIG:
         # Unload lovelace module resource if only instance
@@ -1,6 +1,5 @@
 """Assets manager for VA."""
 
-import asyncio
 from enum import StrEnum
 import logging
 from typing import Any
@@ -23,6 +22,7 @@ from ..const import (  # noqa: TID252
     ATTR_DOWNLOAD_FROM_DEV_BRANCH,
     ATTR_DOWNLOAD_FROM_REPO,
     DOMAIN,
+    OVERLAYS_CACHE,
     VA_ADD_UPDATE_ENTITY_EVENT,
     VERSION_CHECK_INTERVAL,
 )
@@ -35,6 +35,8 @@ from .views import ViewManager
 _LOGGER = logging.getLogger(__name__)
 
 ASSETS_MANAGER = "assets_manager"
+# Seconds to wait to group store updates into one write
+STORE_SAVE_DELAY = 1
 
 
 class AssetClass(StrEnum):
@@ -82,26 +84,26 @@ class AssetsManagerStorage:
         self.hass = hass
         self.data: dict[str, Any] = {}
         self.store = Store(hass, 1, f"{DOMAIN}.assets")
-        self.lock = asyncio.Lock()
 
-    async def _save(self):
-        """Save store."""
-        await self.lock.acquire()
-        self.data["last_updated"] = dt_util.now().isoformat()
-        # Order dict for reading
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return store data ordered for reading."""
         data = self.data.copy()
         last_updated = data.pop("last_updated")
         if data.get("last_commit"):
             last_commit = data.pop("last_commit")
         else:
             last_commit = {}
-        data = {
+        return {
             "last_updated": last_updated,
             "last_commit": last_commit,
             **dict(sorted(data.items(), key=lambda x: x[0].lower())),
         }
-        await self.store.async_save(data)
-        self.lock.release()
+
+    async def _save(self):
+        """Save store."""
+        self.data["last_updated"] = dt_util.now().isoformat()
+        # Updates come in bursts during version checks so write once after them
+        self.store.async_delay_save(self._data_to_save, STORE_SAVE_DELAY)
 
     async def load(self, force: bool = False):
         """Load dashboard data from store."""
@@ -356,6 +358,10 @@ class AssetsManager:
                 }
                 await self.store.update(asset_class, name, self.data[asset_class][name])
 
+                if asset_class == AssetClass.DASHBOARD:
+                    # Clear cached overlay options as they are read from the dashboard
+                    self.hass.data[DOMAIN].pop(OVERLAYS_CACHE, None)
+
     def _fire_updates_update(
         self, asset_class: AssetClass, name: str, remove: bool
     ) -> None:
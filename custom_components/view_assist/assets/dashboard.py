@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import copy
 import logging
 import operator
 from pathlib import Path
@@ -28,7 +29,7 @@ from ..const import (  # noqa: TID252
     GITHUB_BRANCH,
     GITHUB_DEV_BRANCH,
 )
-from ..helpers import differ_to_json, get_key, json_to_dictdiffer  # noqa: TID252
+from ..helpers import differ_to_json, json_to_dictdiffer  # noqa: TID252
 from ..typed import VAConfigEntry  # noqa: TID252
 from ..utils import dictdiff  # noqa: TID252
 from ..websocket import MockWSConnection  # noqa: TID252
@@ -36,6 +37,37 @@ from .base import AssetManagerException, BaseAssetManager, InstallStatus
 
 _LOGGER = logging.getLogger(__name__)
 
+DASHBOARD_VARIABLES_PATH = ("button_card_templates", "variable_template", "variables")
+
+# Parsed yaml files by path with the file mtime and size they were read at
+_YAML_CACHE: dict[str, tuple[tuple[int, int], dict[str, Any]]] = {}
+
+
+def _get_file_key(file_path: str | Path) -> tuple[int, int] | None:
+    """Return file mtime and size to detect changes, None if not found."""
+    try:
+        stat = Path(file_path).stat()
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def _load_yaml_dict_cached(file_path: str | Path) -> dict[str, Any]:
+    """Load yaml file to dict, reusing the last parse if file is unchanged.
+
+    Returns a copy as callers modify the loaded config.
+    """
+    file_path = str(file_path)
+    if (file_key := _get_file_key(file_path)) is None:
+        # Let the yaml loader raise its usual error
+        return load_yaml_dict(file_path)
+
+    cached = _YAML_CACHE.get(file_path)
+    if cached is None or cached[0] != file_key:
+        cached = (file_key, load_yaml_dict(file_path))
+        _YAML_CACHE[file_path] = cached
+    return copy.deepcopy(cached[1])
+
 
 class DashboardManager(BaseAssetManager):
     """Class to manage dashboard assets."""
@@ -46,6 +78,15 @@ class DashboardManager(BaseAssetManager):
         """Initialise."""
         super().__init__(hass, config, data)
         self.ignore_change_events = False
+        # Master file key and dashboard, less views, last compared for user changes
+        self._last_compared_dashboard: (
+            tuple[tuple[int, int] | None, dict[str, Any]] | None
+        ) = None
+        self._dashboard_dir = Path(hass.config.path(DOMAIN), DASHBOARD_DIR)
+        self._dashboard_file_path = Path(self._dashboard_dir, f"{DASHBOARD_DIR}.yaml")
+        self._user_dashboard_file_path = Path(
+            self._dashboard_dir, "user_dashboard.yaml"
+        )
 
     async def async_setup(self) -> None:
         """Set up the AssetManager."""
@@ -179,11 +220,8 @@ class DashboardManager(BaseAssetManager):
 
         self._update_install_progress("dashboard", 50)
 
-        dashboard_file_path = Path(
-            self.hass.config.path(DOMAIN),
-            f"{DASHBOARD_DIR}/{DASHBOARD_DIR}.yaml",
-        )
-        if not Path(dashboard_file_path).exists():
+        dashboard_file_path = self._dashboard_file_path
+        if not dashboard_file_path.exists():
             # No dashboard file
             raise AssetManagerException(
                 f"Dashboard file not found: {dashboard_file_path}"
@@ -191,6 +229,7 @@ class DashboardManager(BaseAssetManager):
 
         # Ignore change events during update/install
         self.ignore_change_events = True
+        self._last_compared_dashboard = None
 
         if not self.is_installed(self._dashboard_key):
             _LOGGER.debug("Installing dashboard")
@@ -212,13 +251,8 @@ class DashboardManager(BaseAssetManager):
                 lovelace: LovelaceData = self.hass.data["lovelace"]
 
                 # Load dashboard config file from path
-                dashboard_file_path = Path(
-                    self.hass.config.path(DOMAIN),
-                    f"{DASHBOARD_DIR}/{DASHBOARD_DIR}.yaml",
-                )
-
                 if new_dashboard_config := await self.hass.async_add_executor_job(
-                    load_yaml_dict, dashboard_file_path
+                    _load_yaml_dict_cached, dashboard_file_path
                 ):
                     self._update_install_progress("dashboard", 70)
                     await lovelace.dashboards[self._dashboard_key].async_save(
@@ -241,7 +275,7 @@ class DashboardManager(BaseAssetManager):
         else:
             _LOGGER.debug("Updating dashboard")
             if new_dashboard_config := await self.hass.async_add_executor_job(
-                load_yaml_dict, dashboard_file_path
+                _load_yaml_dict_cached, dashboard_file_path
             ):
                 lovelace: LovelaceData = self.hass.data["lovelace"]
                 dashboard_store: dashboard.LovelaceStorage = lovelace.dashboards.get(
@@ -253,19 +287,29 @@ class DashboardManager(BaseAssetManager):
 
                     # Copy views to updated dashboard
                     new_dashboard_config["views"] = old_dashboard_config.get("views")
-
-                    # Apply
-                    await dashboard_store.async_save(new_dashboard_config)
+                    installed_version = self._read_dashboard_version(
+                        new_dashboard_config
+                    )
                     self._update_install_progress("dashboard", 80)
 
+                    # Apply user changes before saving to only save once.  The
+                    # patch works on a copy, so on error the update is still saved
                     if not discard_user_dashboard_changes:
-                        await self._apply_user_dashboard_changes()
+                        try:
+                            new_dashboard_config = (
+                                await self._apply_user_dashboard_changes(
+                                    new_dashboard_config
+                                )
+                            )
+                        except Exception as ex:  # noqa: BLE001
+                            _LOGGER.error(
+                                "Error applying user changes to dashboard. Error is %s",
+                                ex,
+                            )
 
+                    # Apply
+                    await dashboard_store.async_save(new_dashboard_config)
                     self._update_install_progress("dashboard", 90)
-
-                    installed_version = self._read_dashboard_version(
-                        new_dashboard_config
-                    )
                     success = True
                 else:
                     raise AssetManagerException("Error getting dashboard store")
@@ -293,37 +337,34 @@ class DashboardManager(BaseAssetManager):
         # Dashboard automatically saves differences when changed
         return True
 
-    @property
-    def _dashboard_key(self) -> str:
-        """Return path for dashboard name."""
-        return DASHBOARD_NAME.replace(" ", "-").lower()
+    # Path for dashboard name
+    _dashboard_key = DASHBOARD_NAME.replace(" ", "-").lower()
 
     def _read_dashboard_version(self, dashboard_config: dict[str, Any]) -> str:
         """Get view version from config."""
         if dashboard_config:
-            try:
-                if variables := get_key(
-                    "button_card_templates.variable_template.variables",
-                    dashboard_config,
-                ):
-                    return variables.get("dashboardversion", "0.0.0")
-            except KeyError:
-                _LOGGER.debug("Dashboard version not found")
+            variables = dashboard_config
+            for key in DASHBOARD_VARIABLES_PATH:
+                if not isinstance(variables, dict):
+                    break
+                variables = variables.get(key)
+            if variables and isinstance(variables, dict):
+                return variables.get("dashboardversion", "0.0.0")
+            _LOGGER.debug("Dashboard version not found")
         return "0.0.0"
 
     async def _download_dashboard(self, cancel_if_exists: bool = False) -> bool:
         """Download dashboard file."""
-        # Ensure download to path exists
-        base = self.hass.config.path(f"{DOMAIN}/{DASHBOARD_DIR}")
-
-        if cancel_if_exists and Path(base, f"{DASHBOARD_DIR}.yaml").exists():
+        if cancel_if_exists and self._dashboard_file_path.exists():
             return False
 
         # Validate view dir on repo
         dir_url = f"{DASHBOARD_VIEWS_GITHUB_PATH}/{DASHBOARD_DIR}"
         if await self.download_manager.async_dir_exists(dir_url):
             # Download dashboard files
-            await self.download_manager.async_download_dir(dir_url, base)
+            await self.download_manager.async_download_dir(
+                dir_url, str(self._dashboard_dir)
+            )
         return True
 
     async def _dashboard_changed(self, event: Event):
@@ -342,18 +383,29 @@ class DashboardManager(BaseAssetManager):
                     dashboard_config = await dashboard_store.async_load(False)
 
                     # Remove views from dashboard config for saving
-                    dashboard_only = dashboard_config.copy()
-                    dashboard_only["views"] = [{"title": "Home"}]
+                    dashboard_only = {**dashboard_config, "views": [{"title": "Home"}]}
 
-                    file_path = Path(self.hass.config.config_dir, DOMAIN, DASHBOARD_DIR)
-                    file_path.mkdir(parents=True, exist_ok=True)
+                    # View only edits leave this and the master unchanged so no
+                    # new user changes
+                    master_key = await self.hass.async_add_executor_job(
+                        _get_file_key, self._dashboard_file_path
+                    )
+                    if self._last_compared_dashboard == (master_key, dashboard_only):
+                        return
+
+                    self._dashboard_dir.mkdir(parents=True, exist_ok=True)
 
                     if diffs := await self._compare_dashboard_to_master(dashboard_only):
                         await self.hass.async_add_executor_job(
                             save_yaml,
-                            Path(file_path, "user_dashboard.yaml"),
+                            self._user_dashboard_file_path,
                             diffs,
                         )
+                    # Copy as dashboard config is shared with lovelace storage
+                    self._last_compared_dashboard = (
+                        master_key,
+                        copy.deepcopy(dashboard_only),
+                    )
 
             except Exception as ex:  # noqa: BLE001
                 _LOGGER.error("Error saving dashboard. Error is %s", ex)
@@ -363,47 +415,38 @@ class DashboardManager(BaseAssetManager):
     ) -> dict[str, Any]:
         """Compare dashboard dict to master and return differences."""
         # Get master dashboard
-        base = self.hass.config.path(DOMAIN)
-        dashboard_file_path = f"{base}/{DASHBOARD_DIR}/{DASHBOARD_DIR}.yaml"
-
-        if not Path(dashboard_file_path).exists():
+        if not self._dashboard_file_path.exists():
             # No master dashboard
             return None
 
         # Load dashboard config file from path
         if master_dashboard := await self.hass.async_add_executor_job(
-            load_yaml_dict, dashboard_file_path
+            _load_yaml_dict_cached, self._dashboard_file_path
         ):
             if not operator.eq(master_dashboard, comp_dash):
                 diffs = dictdiff.diff(master_dashboard, comp_dash, expand=True)
                 return differ_to_json(diffs)
         return None
 
-    async def _apply_user_dashboard_changes(self):
-        """Apply a user_dashboard changes file to master dashboard."""
+    async def _apply_user_dashboard_changes(
+        self, dashboard_config: dict[str, Any]
+    ) -> dict[str, Any]:
+        """Apply a user_dashboard changes file to master dashboard.
 
-        # Get master dashboard
-        base = self.hass.config.path(DOMAIN)
-        user_dashboard_file_path = f"{base}/{DASHBOARD_DIR}/user_dashboard.yaml"
+        Returns the updated dashboard config, or the passed config if no changes.
+        """
 
-        if not Path(user_dashboard_file_path).exists():
+        # Get master dashboard
+        if not self._user_dashboard_file_path.exists():
             # No master dashboard
-            return
+            return dashboard_config
 
         # Load dashboard config file from path
         _LOGGER.debug("Applying user changes to dashboard")
         if user_dashboard := await self.hass.async_add_executor_job(
-            load_yaml_dict, user_dashboard_file_path
+            _load_yaml_dict_cached, self._user_dashboard_file_path
         ):
-            lovelace: LovelaceData = self.hass.data["lovelace"]
-            dashboard_store: dashboard.LovelaceStorage = lovelace.dashboards.get(
-                self._dashboard_key
-            )
-            # Load dashboard config data
-            if dashboard_store:
-                dashboard_config = await dashboard_store.async_load(False)
-
-                # Apply
-                user_changes = json_to_dictdiffer(user_dashboard)
-                updated_dashboard = dictdiff.patch(user_changes, dashboard_config)
-                await dashboard_store.async_save(updated_dashboard)
+            # Apply
+            user_changes = json_to_dictdiffer(user_dashboard)
+            return dictdiff.patch(user_changes, dashboard_config)
+        return dashboard_config
@@ -1,8 +1,13 @@
 """Download manager for View Assist assets."""
 
+import asyncio
+from collections.abc import Mapping
+from contextlib import nullcontext
 from dataclasses import dataclass
 import logging
 from pathlib import Path
+import random
+import time
 from typing import Any
 import urllib.parse
 
@@ -17,6 +22,10 @@ _LOGGER = logging.getLogger(__name__)
 
 GITHUB_TOKEN_FILE = "github.token"
 MAX_DIR_DEPTH = 5
+# Keep parallel file downloads under github secondary rate limits
+MAX_CONCURRENT_DOWNLOADS = 8
+RATE_LIMIT_RETRIES = 3
+MAX_RATE_LIMIT_WAIT = 60
 
 
 class AssetManagerException(Exception):
@@ -45,6 +54,26 @@ class GithubNotFoundException(GithubAPIException):
     """A github not found exception."""
 
 
+def _get_rate_limit_wait(headers: Mapping[str, str]) -> float | None:
+    """Get seconds to wait before retrying a rate limited request.
+
+    Returns None if github gave no wait time or it is too long to wait for.
+    """
+    try:
+        if retry_after := headers.get("Retry-After"):
+            wait = float(retry_after)
+        elif headers.get("X-RateLimit-Remaining") == "0":
+            wait = float(headers["X-RateLimit-Reset"]) - time.time()
+        else:
+            return None
+    except (KeyError, ValueError):
+        return None
+    if wait > MAX_RATE_LIMIT_WAIT:
+        return None
+    # Add jitter so concurrent requests do not all retry at once
+    return max(wait, 0) + random.random()
+
+
 class GitHubAPI:
     """Class to handle basic Github repo rest commands."""
 
@@ -58,6 +87,10 @@ class GitHubAPI:
         self.api_base = f"https://api.github.com/repos/{self.repo}"
         self.path_base = f"https://github.com/{self.repo}/tree/{self.branch}"
         self.raw_base = f"https://raw.githubusercontent.com/{self.repo}/{self.branch}"
+        # Shared HA session, pooling keep-alive connections to github
+        self._session = async_get_clientsession(hass)
+        self._token: str | None = None
+        self._token_loaded = False
 
     def _get_token(self):
         # Use HACs token if available
@@ -68,45 +101,61 @@ class GitHubAPI:
                 _LOGGER.debug("HACS is installed but token not available")
         # Otherwise use the token file in the config directory if exists
         token_file = self.hass.config.path(f"{DOMAIN}/{GITHUB_TOKEN_FILE}")
-        if Path(token_file).exists():
+        try:
             with Path(token_file).open("r", encoding="utf-8") as f:
                 return f.read()
-        return None
+        except FileNotFoundError:
+            return None
 
     async def _rest_request(
-        self, url: str, data_as_text: bool = False
+        self,
+        url: str,
+        data_as_text: bool = False,
+        limiter: asyncio.Semaphore | None = None,
     ) -> str | dict | list | None:
-        """Return rest request data."""
-        session = async_get_clientsession(self.hass)
+        """Return rest request data.
 
+        If a limiter is given it is only held for each request, not while
+        waiting to retry a rate limited request.
+        """
         kwargs = {}
         if self.api_base in url:
-            if token := await self.hass.async_add_executor_job(self._get_token):
+            # Read token once for this api instance, not on every request
+            if not self._token_loaded:
+                self._token = await self.hass.async_add_executor_job(self._get_token)
+                self._token_loaded = True
+            if token := self._token:
                 kwargs["headers"] = {"authorization": f"Bearer {token}"}
                 # _LOGGER.debug("Making api request with auth token - %s", url)
             # else:
             #    _LOGGER.debug("Making api request without auth token - %s", url)
 
-        async with session.get(url, **kwargs) as resp:
-            if resp.status == 200:
-                try:
-                    return await resp.json()
-                except ContentTypeError:
-                    if data_as_text:
-                        return await resp.text()
-                    return await resp.read()
-
-            elif resp.status == 403:
-                # Rate limit
-                raise GithubRateLimitException(
-                    "Github api rate limit exceeded for this hour.  You may need to add a personal access token to authenticate and increase the limit"
-                )
-            elif resp.status == 404:
-                raise GithubNotFoundException(
-                    f"Path not found on this repository.  {url}"
-                )
-            else:
-                raise GithubAPIException(await resp.json())
+        for attempt in range(RATE_LIMIT_RETRIES + 1):
+            async with limiter or nullcontext():
+                async with self._session.get(url, **kwargs) as resp:
+                    if resp.status == 200:
+                        try:
+                            return await resp.json()
+                        except ContentTypeError:
+                            if data_as_text:
+                                return await resp.text()
+                            return await resp.read()
+
+                    elif resp.status in (403, 429):
+                        # Rate limit - retry if github says it will clear shortly
+                        wait = _get_rate_limit_wait(resp.headers)
+                        if wait is None or attempt == RATE_LIMIT_RETRIES:
+                            raise GithubRateLimitException(
+                                "Github api rate limit exceeded for this hour.  You may need to add a personal access token to authenticate and increase the limit"
+                            )
+                    elif resp.status == 404:
+                        raise GithubNotFoundException(
+                            f"Path not found on this repository.  {url}"
+                        )
+                    else:
+                        raise GithubAPIException(await resp.json())
+            _LOGGER.debug("Github rate limited, retrying in %.1fs - %s", wait, url)
+            await asyncio.sleep(wait)
         return None
 
     async def async_get_last_commit(self, path: str) -> dict[str, Any] | None:
@@ -150,18 +199,59 @@ class GitHubAPI:
                     GithubFileDir(e["name"], e["type"], e["path"], e["download_url"])
                     for e in raw_data
                 ]
+        except GithubNotFoundException:
+            # Callers report a missing path in their own terms
+            _LOGGER.debug("Path not found: %s", path)
+        except GithubAPIException as ex:
+            _LOGGER.error(ex)
+        return None
+
+    async def get_tree(
+        self, path: str = "", recursive: bool = True
+    ) -> list[GithubFileDir] | None:
+        """Get github repo file tree below path for the branch in one request."""
+        # Tree-ish of branch:path gets only the subtree below path
+        tree_ish = urllib.parse.quote(
+            f"{self.branch}:{path}" if path else self.branch, safe="/:"
+        )
+        url_path = f"{self.api_base}/git/trees/{tree_ish}"
+        if recursive:
+            url_path = f"{url_path}?recursive=1"
+        # Subtree entry paths are relative to path
+        prefix = f"{path}/" if path else ""
+
+        try:
+            if raw_data := await self._rest_request(url_path):
+                if raw_data.get("truncated"):
+                    # Partial listing cannot be relied on for existence checks
+                    _LOGGER.debug("Repo tree listing truncated")
+                    return None
+                return [
+                    GithubFileDir(
+                        e["path"].rsplit("/", 1)[-1],
+                        "dir" if e["type"] == "tree" else "file",
+                        f"{prefix}{e['path']}",
+                    )
+                    for e in raw_data.get("tree", [])
+                    if e["type"] in ("tree", "blob")
+                ]
         except GithubAPIException as ex:
             _LOGGER.error(ex)
         return None
 
     async def get_file_contents(
-        self, path: str, data_as_text: bool = False
+        self,
+        path: str,
+        data_as_text: bool = False,
+        limiter: asyncio.Semaphore | None = None,
     ) -> bytes | None:
         """Download file."""
         path = urllib.parse.quote(path)
         url_path = f"{self.raw_base}/{path}?ref={self.branch}"
 
-        if file_data := await self._rest_request(url_path, data_as_text=data_as_text):
+        if file_data := await self._rest_request(
+            url_path, data_as_text=data_as_text, limiter=limiter
+        ):
             return file_data
         _LOGGER.debug("Failed to download file")
         return None
@@ -174,6 +264,7 @@ class DownloadManager:
         """Initialise."""
         self.hass = hass
         self.github = GitHubAPI(hass, GITHUB_REPO, GITHUB_BRANCH)
+        self._download_semaphore = asyncio.Semaphore(MAX_CONCURRENT_DOWNLOADS)
 
     def set_branch(self, branch: str) -> None:
         """Set the branch to use for downloads."""
@@ -202,52 +293,116 @@ class DownloadManager:
             ) from ex
         return None
 
+    async def async_get_tree(self, path: str) -> list[GithubFileDir] | None:
+        """Get all dirs and files below a repo path with a single request."""
+        return await self.github.get_tree(path, recursive=True)
+
+    async def _async_download_file(
+        self, file_path: str, save_path: str, file_name: str
+    ) -> None:
+        """Download a single file and save it."""
+        _LOGGER.debug("Downloading file %s", file_path)
+        file_data = await self.github.get_file_contents(
+            file_path, data_as_text=False, limiter=self._download_semaphore
+        )
+        if file_data:
+            await self.hass.async_add_executor_job(
+                self._save_binary_to_file,
+                file_data,
+                save_path,
+                file_name,
+            )
+        else:
+            raise AssetManagerException(
+                f"Error downloading {file_name} from the github repository."
+            )
+
+    async def async_download_tree_dir(
+        self, tree: list[GithubFileDir], download_dir_path: str, save_path: str
+    ) -> list[str]:
+        """Download all files in a directory using an already fetched repo tree.
+
+        Returns the paths, relative to save_path, of the files written.
+        """
+        prefix = f"{download_dir_path}/"
+        downloaded: list[str] = []
+        downloads = []
+        for entry in tree:
+            if entry.type != "file" or not entry.path.startswith(prefix):
+                continue
+            rel_path = entry.path.removeprefix(prefix)
+            if rel_path.count("/") > MAX_DIR_DEPTH:
+                continue
+            rel_dir = rel_path.rpartition("/")[0]
+            downloads.append(
+                self._async_download_file(
+                    entry.path,
+                    f"{save_path}/{rel_dir}" if rel_dir else save_path,
+                    entry.name,
+                )
+            )
+            downloaded.append(rel_path)
+        try:
+            await asyncio.gather(*downloads)
+        except GithubAPIException as ex:
+            raise AssetManagerException(
+                f"Error downloading {download_dir_path} from the github repository.  Error is {ex}"
+            ) from ex
+        return downloaded
+
     async def async_download_dir(
         self, download_dir_path: str, save_path: str, depth: int = 1
-    ) -> bool:
-        """Download all files in a directory."""
+    ) -> list[str]:
+        """Download all files in a directory.
+
+        Returns the paths, relative to save_path, of the files written.
+        """
+        downloaded: list[str] = []
         try:
             if dir_listing := await self.github.get_dir_listing(download_dir_path):
                 _LOGGER.debug("Downloading %s", download_dir_path)
-                # Recurse directories
-                for entry in dir_listing:
-                    if entry.type == "dir" and depth <= MAX_DIR_DEPTH:
-                        await self.async_download_dir(
+                sub_dirs = [
+                    entry
+                    for entry in dir_listing
+                    if entry.type == "dir" and depth <= MAX_DIR_DEPTH
+                ]
+                files = [entry for entry in dir_listing if entry.type == "file"]
+                # Recurse directories and download files concurrently
+                results = await asyncio.gather(
+                    *(
+                        self.async_download_dir(
                             entry.path,
                             f"{save_path}/{entry.name}",
                             depth=depth + 1,
                         )
-                    elif entry.type == "file":
-                        _LOGGER.debug(
-                            "Downloading file %s", f"{download_dir_path}/{entry.name}"
-                        )
-                        if file_data := await self.github.get_file_contents(
-                            entry.path, data_as_text=False
-                        ):
-                            await self.hass.async_add_executor_job(
-                                self._save_binary_to_file,
-                                file_data,
-                                save_path,
-                                entry.name,
-                            )
-                        else:
-                            raise AssetManagerException(
-                                f"Error downloading {entry.name} from the github repository."
-                            )
-                return True
+                        for entry in sub_dirs
+                    ),
+                    *(
+                        self._async_download_file(entry.path, save_path, entry.name)
+                        for entry in files
+                    ),
+                )
+                for entry, sub_downloaded in zip(sub_dirs, results, strict=False):
+                    downloaded.extend(f"{entry.name}/{f}" for f in sub_downloaded)
+                downloaded.extend(entry.name for entry in files)
         except GithubAPIException as ex:
             raise AssetManagerException(
                 f"Error downloading {download_dir_path} from the github repository.  Error is {ex}"
             ) from ex
-        else:
-            return False
+        return downloaded
+
+    async def get_file_contents(
+        self, file_path: str, raw: bool = False
+    ) -> str | bytes | None:
+        """Get the contents of a file.
 
-    async def get_file_contents(self, file_path: str) -> str | None:
-        """Get the contents of a file."""
+        If raw is set, the undecoded bytes are returned.
+        """
         try:
-            if file_data := await self.github.get_file_contents(
-                file_path, data_as_text=True
-            ):
+            file_data = await self.github.get_file_contents(
+                file_path, data_as_text=not raw, limiter=self._download_semaphore
+            )
+            if file_data:
                 return file_data
         except GithubAPIException as ex:
             raise AssetManagerException(
@@ -1,11 +1,16 @@
 """Assets manager for views."""
 
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 import logging
+import os
 from pathlib import Path
 from typing import Any
 
 from homeassistant.components.lovelace import LovelaceData, dashboard
 from homeassistant.const import EVENT_PANELS_UPDATED
+from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.util.yaml import load_yaml_dict, parse_yaml, save_yaml
 
@@ -19,14 +24,48 @@ from ..const import (  # noqa: TID252
     GITHUB_DEV_BRANCH,
     VIEWS_DIR,
 )
+from ..typed import VAConfigEntry  # noqa: TID252
 from .base import AssetManagerException, BaseAssetManager, InstallStatus
+from .download_manager import GithubFileDir
 
 _LOGGER = logging.getLogger(__name__)
 
 
+def _find_view_file(file_path: Path, file_options: tuple[str, ...]) -> Path | None:
+    """Return the first file option that exists in the view directory."""
+    try:
+        with os.scandir(file_path) as it:
+            entries = {entry.name for entry in it}
+    except FileNotFoundError:
+        return None
+    return next((file_path / f for f in file_options if f in entries), None)
+
+
+def _view_file_exists(base: Path, name: str) -> bool:
+    """Return if the view file exists in the view directory."""
+    return Path(base, name, f"{name}.yaml").exists()
+
+
+def _check_and_mkdir(base: Path, name: str) -> bool:
+    """Ensure the view directory exists and return if its view file exists."""
+    view_dir = Path(base, name)
+    exists = (view_dir / f"{name}.yaml").exists()
+    view_dir.mkdir(parents=True, exist_ok=True)
+    return exists
+
+
 class ViewManager(BaseAssetManager):
     """Class to manage view assets."""
 
+    def __init__(
+        self, hass: HomeAssistant, config: VAConfigEntry, data: dict[str, Any]
+    ) -> None:
+        """Initialise."""
+        super().__init__(hass, config, data)
+        self._batch_config: dict[str, Any] | None = None
+        self._repo_tree: list[GithubFileDir] | None = None
+        self._views_dir = Path(hass.config.path(DOMAIN), VIEWS_DIR)
+
     async def async_onboard(self, force: bool = False) -> dict[str, Any] | None:
         """Onboard the user if not yet setup."""
         # Check if onboarding is needed and if so, run it
@@ -34,37 +73,54 @@ class ViewManager(BaseAssetManager):
             self.onboarding = True
             vw_versions = {}
             views = await self._async_get_view_list()
-            for view in views:
-                # If dashboard and views exist and we are just migrating to managed views
-                if await self.async_is_installed(view):
-                    # Download latest version of view
-                    await self._download_view(view, cancel_if_exists=True)
-
-                    installed_version = await self.async_get_installed_version(view)
-                    latest_version = await self.async_get_latest_version(view)
-                    _LOGGER.debug(
-                        "View %s already installed.  Registering version - %s",
-                        view,
-                        installed_version,
-                    )
-                    vw_versions[view] = {
-                        "installed": installed_version,
-                        "latest": latest_version,
-                    }
-                    continue
-
-                # Install view from already downloaded file or repo
-                result = await self.async_install_or_update(view, download=True)
-                if result.installed:
-                    vw_versions[view] = {
-                        "installed": result.version,
-                        "latest": result.latest_version,
-                    }
-
-            # Delete Home view from default dashboard
-            await self.delete_view("home")
-
-            self.onboarding = False
+            # Onboarding installs from the main branch, so get the tree from it too
+            self.download_manager.set_branch(GITHUB_BRANCH)
+            try:
+                # Get all repo view files in one request to save listing each view dir
+                self._repo_tree = await self.download_manager.async_get_tree(
+                    f"{DASHBOARD_VIEWS_GITHUB_PATH}/{VIEWS_DIR}"
+                )
+                # Save dashboard once after all views are installed
+                async with self._dashboard_batch():
+                    for view in views:
+                        # If dashboard and views exist and we are just migrating to managed views
+                        if await self.async_is_installed(view):
+                            # Download latest version of view
+                            await self._download_view(view, cancel_if_exists=True)
+
+                            installed_version = await self.async_get_installed_version(
+                                view
+                            )
+                            latest_version = await self.async_get_latest_version(view)
+                            _LOGGER.debug(
+                                "View %s already installed.  Registering version - %s",
+                                view,
+                                installed_version,
+                            )
+                            vw_versions[view] = {
+                                "installed": installed_version,
+                                "latest": latest_version,
+                            }
+                            continue
+
+                        # Install view from already downloaded file or repo
+                        result = await self.async_install_or_update(view, download=True)
+                        if result.installed:
+                            vw_versions[view] = {
+                                "installed": result.version,
+                                "latest": result.latest_version,
+                            }
+
+                # Delete Home view from default dashboard
+                await self.delete_view("home")
+
+                # Notify frontend once all onboarding changes are saved
+                self.hass.bus.async_fire(EVENT_PANELS_UPDATED)
+            finally:
+                # Later downloads must not use the onboarding repo tree
+                self._repo_tree = None
+                self.onboarding = False
+
             return vw_versions
         return None
 
@@ -84,8 +140,10 @@ class ViewManager(BaseAssetManager):
     async def async_get_latest_version(self, name: str) -> str | None:
         """Get latest version of asset."""
         view_path = f"{DASHBOARD_VIEWS_GITHUB_PATH}/{VIEWS_DIR}/{name}/{name}.yaml"
-        if view_data := await self.download_manager.get_file_contents(view_path):
-            # Parse yaml string to json
+        if view_data := await self.download_manager.get_file_contents(
+            view_path, raw=True
+        ):
+            # Parse yaml bytes to json - the loader decodes the raw buffer itself
             try:
                 view_data = parse_yaml(view_data)
                 return self._read_view_version(name, view_data)
@@ -93,22 +151,53 @@ class ViewManager(BaseAssetManager):
                 _LOGGER.error("Failed to parse view %s", name)
         return None
 
+    async def _async_get_downloaded_version(self, name: str) -> str | None:
+        """Get version of the view file last downloaded from the repo.
+
+        Only current if downloaded by the calling install or update.
+        """
+        file = Path(self._views_dir, name, f"{name}.yaml")
+        try:
+            view_data = await self.hass.async_add_executor_job(file.read_bytes)
+            return self._read_view_version(name, parse_yaml(view_data))
+        except (OSError, HomeAssistantError):
+            return None
+
     async def async_get_version_info(
         self, update_from_repo: bool = True
     ) -> dict[str, Any]:
         """Update versions from repo."""
-        # Get the latest versions of blueprints
+        # Get the latest versions of views
         vw_versions = {}
         if blueprints := await self._async_get_view_list():
-            for name in blueprints:
-                installed_version = await self.async_get_installed_version(name)
-                latest_version = (
-                    await self.async_get_latest_version(name)
-                    if update_from_repo
-                    else self.data.get(name, {}).get("latest")
+            if update_from_repo:
+                # Fetch from repo concurrently, download manager limits requests
+                results = await asyncio.gather(
+                    *(self.async_get_latest_version(name) for name in blueprints),
+                    return_exceptions=True,
                 )
+                latest_versions = []
+                for name, result in zip(blueprints, results, strict=True):
+                    if isinstance(result, Exception):
+                        # Keep the stored latest version for a view that failed
+                        _LOGGER.error(
+                            "Unable to get latest version for view %s.  Error is %s",
+                            name,
+                            result,
+                        )
+                        result = self.data.get(name, {}).get("latest")
+                    latest_versions.append(result)
+            else:
+                latest_versions = [
+                    self.data.get(name, {}).get("latest") for name in blueprints
+                ]
+            # Read installed versions from one pass over the dashboard views
+            view_configs = await self._async_get_view_configs()
+            for name, latest_version in zip(blueprints, latest_versions, strict=True):
                 vw_versions[name] = {
-                    "installed": installed_version,
+                    "installed": self._read_view_version(name, view_config)
+                    if (view_config := view_configs.get(name))
+                    else None,
                     "latest": latest_version,
                 }
         return vw_versions
@@ -128,11 +217,12 @@ class ViewManager(BaseAssetManager):
         """Install or update asset."""
 
         self._update_install_progress(name, 0)
+        title = name.title()
         success = False
         installed_version = None
 
         view_index = await self._async_get_view_index(name)
-        file_path = Path(self.hass.config.path(DOMAIN), VIEWS_DIR, name)
+        file_path = self._views_dir / name
 
         _LOGGER.debug("%s view %s", "Updating" if view_index else "Adding", name)
 
@@ -147,8 +237,12 @@ class ViewManager(BaseAssetManager):
 
         # Download view if required
         downloaded = False
+        # Set if the repo view file was downloaded by this call
+        repo_file_downloaded = False
         # Don't download if file exists during onboarding
-        if self.onboarding and Path(file_path, f"{name}.yaml").exists():
+        if self.onboarding and await self.hass.async_add_executor_job(
+            _check_and_mkdir, self._views_dir, name
+        ):
             _LOGGER.debug("View file already exists for %s.  Not downloading", name)
             downloaded = True
         elif download:
@@ -165,6 +259,7 @@ class ViewManager(BaseAssetManager):
                 raise AssetManagerException(
                     f"Unable to download view {name}.  Please check the view name and try again."
                 )
+            repo_file_downloaded = True
 
         self._update_install_progress(name, 50)
 
@@ -172,13 +267,11 @@ class ViewManager(BaseAssetManager):
         try:
             _LOGGER.debug("Installing view %s", name)
             # Load in order of existence - user view version (for later feature), default version, saved version
-            file: Path = None
-            file_options = [f"user_{name}.yaml", f"{name}.yaml", f"{name}.saved.yaml"]
-
-            for file_option in file_options:
-                if Path(file_path, file_option).exists():
-                    file = Path(file_path, file_option)
-                    break
+            file: Path | None = await self.hass.async_add_executor_job(
+                _find_view_file,
+                file_path,
+                (f"user_{name}.yaml", f"{name}.yaml", f"{name}.saved.yaml"),
+            )
 
             if file:
                 new_view_config = await self.hass.async_add_executor_job(
@@ -204,12 +297,15 @@ class ViewManager(BaseAssetManager):
 
         # Load dashboard config data
         if new_view_config and dashboard_store:
-            dashboard_config = await dashboard_store.async_load(False)
+            if self._batch_config is not None:
+                dashboard_config = self._batch_config
+            else:
+                dashboard_config = await dashboard_store.async_load(False)
 
             # Create new view and add it to dashboard
             new_view = {
                 "type": "panel",
-                "title": name.title(),
+                "title": title,
                 "path": name,
                 "cards": [new_view_config],
             }
@@ -226,9 +322,11 @@ class ViewManager(BaseAssetManager):
 
             self._update_install_progress(name, 90)
 
-            # Save dashboard config back to HA
-            await dashboard_store.async_save(dashboard_config)
-            self.hass.bus.async_fire(EVENT_PANELS_UPDATED)
+            # Save dashboard config back to HA unless batching changes
+            if self._batch_config is None:
+                await dashboard_store.async_save(dashboard_config)
+                if not self.onboarding:
+                    self.hass.bus.async_fire(EVENT_PANELS_UPDATED)
 
             success = True
 
@@ -241,16 +339,26 @@ class ViewManager(BaseAssetManager):
             name,
             installed_version,
         )
+        if downloaded and success:
+            latest_version = installed_version
+            # A user or saved view may have been installed, so read the repo file
+            # just downloaded rather than going back to the repo
+            if repo_file_downloaded and file.name != f"{name}.yaml":
+                latest_version = (
+                    await self._async_get_downloaded_version(name) or latest_version
+                )
+        else:
+            latest_version = await self.async_get_latest_version(name)
+
         return InstallStatus(
             installed=success,
             version=installed_version,
-            latest_version=installed_version
-            if downloaded and success
-            else await self.async_get_latest_version(name),
+            latest_version=latest_version,
         )
 
     async def async_save(self, name: str) -> bool:
         """Backup a view to a file."""
+        name_lower = name.lower()
 
         # Get lovelace (frontend) config data
         lovelace: LovelaceData = self.hass.data["lovelace"]
@@ -266,41 +374,63 @@ class ViewManager(BaseAssetManager):
 
             # Make list of existing view names for this dashboard
             for view in dashboard_config["views"]:
-                if view.get("path") == name.lower():
-                    file_path = Path(
-                        self.hass.config.path(DOMAIN), VIEWS_DIR, name.lower()
-                    )
-                    file_name = f"{name.lower()}.saved.yaml"
+                if view.get("path") == name_lower:
+                    file_path = self._views_dir / name_lower
+                    file_name = f"{name_lower}.saved.yaml"
 
-                    if view.get("cards", []):
+                    if cards := view.get("cards", []):
                         # Ensure path exists
-                        file_path.mkdir(parents=True, exist_ok=True)
+                        await self.hass.async_add_executor_job(
+                            _check_and_mkdir, self._views_dir, name_lower
+                        )
                         return await self.hass.async_add_executor_job(
                             save_yaml,
-                            Path(file_path, file_name),
-                            view.get("cards", [])[0],
+                            file_path / file_name,
+                            cards[0],
                         )
 
                     raise AssetManagerException(f"No view data to save for {name} view")
         return False
 
-    async def _async_get_view_list(self) -> list[str]:
+    async def _async_get_view_list(self) -> tuple[str, ...]:
         """Get the list of views from repo."""
         if data := await self.download_manager.async_get_dir_listing(
             f"{DASHBOARD_VIEWS_GITHUB_PATH}/{VIEWS_DIR}"
         ):
-            return [
-                view.name
-                for view in data
-                if view.type == "dir"
-                if view.name != COMMUNITY_VIEWS_DIR
-            ]
-        return []
+            # dict keys keep repo order and drop any duplicate names
+            return tuple(
+                dict.fromkeys(
+                    view.name
+                    for view in data
+                    if view.type == "dir"
+                    if view.name != COMMUNITY_VIEWS_DIR
+                )
+            )
+        return ()
 
-    @property
-    def _dashboard_key(self) -> str:
-        """Return path for dashboard name."""
-        return DASHBOARD_NAME.replace(" ", "-").lower()
+    @asynccontextmanager
+    async def _dashboard_batch(self) -> AsyncIterator[dict[str, Any] | None]:
+        """Hold dashboard view changes and save them once on exit."""
+        lovelace: LovelaceData = self.hass.data["lovelace"]
+        dashboard_store: dashboard.LovelaceStorage = lovelace.dashboards.get(
+            self._dashboard_key
+        )
+        if not dashboard_store:
+            yield None
+            return
+
+        self._batch_config = await dashboard_store.async_load(False)
+        try:
+            yield self._batch_config
+        finally:
+            dashboard_config = self._batch_config
+            self._batch_config = None
+            await dashboard_store.async_save(dashboard_config)
+            if not self.onboarding:
+                self.hass.bus.async_fire(EVENT_PANELS_UPDATED)
+
+    # Path for dashboard name
+    _dashboard_key = DASHBOARD_NAME.replace(" ", "-").lower()
 
     @property
     def _dashboard_exists(self) -> bool:
@@ -315,14 +445,11 @@ class ViewManager(BaseAssetManager):
 
     def _read_view_version(self, view: str, view_config: dict[str, Any]) -> str:
         """Get view version from config."""
-        if view_config:
-            try:
-                if variables := view_config.get("variables"):
-                    return variables.get(
-                        f"{view}version", variables.get(f"{view}cardversion", "0.0.0")
-                    )
-            except KeyError:
-                _LOGGER.debug("View %s version not found", view)
+        if view_config and (variables := view_config.get("variables")):
+            version = variables.get(view + "version")
+            if version is None:
+                version = variables.get(view + "cardversion", "0.0.0")
+            return version
         return "0.0.0"
 
     async def _async_get_view_index(self, view: str) -> int:
@@ -344,6 +471,11 @@ class ViewManager(BaseAssetManager):
 
     async def _async_get_view_config(self, view: str) -> dict[str, Any]:
         """Get view config."""
+        return (await self._async_get_view_configs()).get(view, {})
+
+    async def _async_get_view_configs(self) -> dict[str, dict[str, Any]]:
+        """Get view configs of all dashboard views by view path."""
+        view_configs = {}
         lovelace: LovelaceData = self.hass.data["lovelace"]
         dashboard_store: dashboard.LovelaceStorage = lovelace.dashboards.get(
             self._dashboard_key
@@ -352,12 +484,11 @@ class ViewManager(BaseAssetManager):
         if dashboard_store:
             dashboard_config = await dashboard_store.async_load(False)
             for ex_view in dashboard_config["views"]:
-                if ex_view.get("path") == view:
-                    if cards := ex_view.get("cards", []):
-                        if isinstance(cards, list):
-                            # Get first card in list
-                            return cards[0]
-        return {}
+                if cards := ex_view.get("cards", []):
+                    if isinstance(cards, list):
+                        # Get first card in list, first view for a path wins
+                        view_configs.setdefault(ex_view.get("path"), cards[0])
+        return view_configs
 
     async def _download_view(
         self,
@@ -367,32 +498,39 @@ class ViewManager(BaseAssetManager):
     ):
         """Download view files from a github repo directory."""
 
-        # Ensure download to path exists
-        base = self.hass.config.path(f"{DOMAIN}/{VIEWS_DIR}")
+        base = self._views_dir
         if community_view:
             dir_url = f"{DASHBOARD_VIEWS_GITHUB_PATH}/{VIEWS_DIR}/{COMMUNITY_VIEWS_DIR}/{view_name}"
         else:
             dir_url = f"{DASHBOARD_VIEWS_GITHUB_PATH}/{VIEWS_DIR}/{view_name}"
 
-        if cancel_if_exists and Path(base, view_name, f"{view_name}.yaml").exists():
+        if cancel_if_exists and await self.hass.async_add_executor_job(
+            _view_file_exists, base, view_name
+        ):
             return False
 
-        # Validate view dir on repo
-        if await self.download_manager.async_dir_exists(dir_url):
-            # Create view directory
-            Path(base, view_name).mkdir(parents=True, exist_ok=True)
-
-            # Download view files
-            success = await self.download_manager.async_download_dir(
+        # Download view files, view directory is created when files are saved
+        if self._repo_tree is not None:
+            downloaded = await self.download_manager.async_download_tree_dir(
+                self._repo_tree, dir_url, Path(base, view_name)
+            )
+        else:
+            downloaded = await self.download_manager.async_download_dir(
                 dir_url, Path(base, view_name)
             )
 
-            # Validate yaml file and install view
-            if success and Path(base, view_name, f"{view_name}.yaml").exists():
-                _LOGGER.debug("Downloaded %s", view_name)
-                return True
+        # Validate yaml file was downloaded
+        if f"{view_name}.yaml" in downloaded:
+            _LOGGER.debug("Downloaded %s", view_name)
+            return True
 
-        _LOGGER.error("Failed to download %s", view_name)
+        if not downloaded and (
+            self._repo_tree is not None
+            or not await self.download_manager.async_dir_exists(dir_url)
+        ):
+            _LOGGER.error("View %s not found in repo", view_name)
+        else:
+            _LOGGER.error("Failed to download %s", view_name)
         return False
 
     async def delete_view(self, view: str):
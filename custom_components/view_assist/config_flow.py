@@ -1,15 +1,14 @@
 """Config flow handler."""
 
+from collections.abc import Mapping
+from functools import cached_property, lru_cache
 import logging
+from pathlib import Path
 from typing import Any
 
 from awesomeversion import AwesomeVersion
 import voluptuous as vol
 
-from homeassistant.components.assist_satellite import DOMAIN as ASSIST_SAT_DOMAIN
-from homeassistant.components.media_player import DOMAIN as MEDIAPLAYER_DOMAIN
-from homeassistant.components.sensor import DOMAIN as SENSOR_DOMAIN
-from homeassistant.components.weather import DOMAIN as WEATHER_DOMAIN
 from homeassistant.config_entries import ConfigFlow, OptionsFlow
 from homeassistant.const import CONF_MODE, CONF_NAME, CONF_TYPE, Platform
 from homeassistant.core import HomeAssistant, callback
@@ -65,18 +64,23 @@ from .const import (
     CONF_USE_ANNOUNCE,
     CONF_VIEW_TIMEOUT,
     CONF_WEATHER_ENTITY,
+    DASHBOARD_DIR,
     DEFAULT_NAME,
     DEFAULT_TYPE,
     DEFAULT_VALUES,
+    DISPLAY_DEVICES_CACHE,
     DOMAIN,
     MIN_DASHBOARD_FOR_OVERLAYS,
+    OVERLAY_FILE_NAME,
+    OVERLAYS_CACHE,
     REMOTE_ASSIST_DISPLAY_DOMAIN,
+    SUGGESTED_VALUES_CACHE,
     VACA_DOMAIN,
     VAIconSizes,
 )
 from .helpers import (
     get_available_overlays,
-    get_devices_for_domain,
+    get_devices_for_domains,
     get_master_config_entry,
 )
 from .typed import (
@@ -96,135 +100,249 @@ DEVICE_FORM_DESCRIPTION = (
     "Setting values here will override the master config settings for this device"
 )
 
+# Entry settings always offered as display device options
+_EXTRA_DEVICE_ATTRS = (CONF_DISPLAY_DEVICE, CONF_DEVELOPER_DEVICE)
+
+_MIC_ENTITY_SELECTOR = EntitySelector(
+    EntitySelectorConfig(
+        filter=[
+            EntityFilterSelectorConfig(
+                integration="esphome", domain=Platform.ASSIST_SATELLITE
+            ),
+            EntityFilterSelectorConfig(
+                integration="hassmic",
+                domain=[Platform.SENSOR, Platform.ASSIST_SATELLITE],
+            ),
+            EntityFilterSelectorConfig(
+                integration="stream_assist",
+                domain=[Platform.SENSOR, Platform.ASSIST_SATELLITE],
+            ),
+            EntityFilterSelectorConfig(
+                integration="wyoming", domain=Platform.ASSIST_SATELLITE
+            ),
+            EntityFilterSelectorConfig(
+                integration=VACA_DOMAIN, domain=Platform.ASSIST_SATELLITE
+            ),
+        ]
+    )
+)
+_MEDIAPLAYER_SELECTOR = EntitySelector(
+    EntitySelectorConfig(domain=Platform.MEDIA_PLAYER)
+)
+
 BASE_DEVICE_SCHEMA = vol.Schema(
     {
         vol.Required(CONF_NAME): str,
-        vol.Required(CONF_MIC_DEVICE): EntitySelector(
-            EntitySelectorConfig(
-                filter=[
-                    EntityFilterSelectorConfig(
-                        integration="esphome", domain=ASSIST_SAT_DOMAIN
-                    ),
-                    EntityFilterSelectorConfig(
-                        integration="hassmic", domain=[SENSOR_DOMAIN, ASSIST_SAT_DOMAIN]
-                    ),
-                    EntityFilterSelectorConfig(
-                        integration="stream_assist",
-                        domain=[SENSOR_DOMAIN, ASSIST_SAT_DOMAIN],
-                    ),
-                    EntityFilterSelectorConfig(
-                        integration="wyoming", domain=ASSIST_SAT_DOMAIN
-                    ),
-                    EntityFilterSelectorConfig(
-                        integration=VACA_DOMAIN, domain=ASSIST_SAT_DOMAIN
-                    ),
-                ]
-            )
-        ),
-        vol.Required(CONF_MEDIAPLAYER_DEVICE): EntitySelector(
-            EntitySelectorConfig(domain=MEDIAPLAYER_DOMAIN)
-        ),
-        vol.Required(CONF_MUSICPLAYER_DEVICE): EntitySelector(
-            EntitySelectorConfig(domain=MEDIAPLAYER_DOMAIN)
-        ),
+        vol.Required(CONF_MIC_DEVICE): _MIC_ENTITY_SELECTOR,
+        vol.Required(CONF_MEDIAPLAYER_DEVICE): _MEDIAPLAYER_SELECTOR,
+        vol.Required(CONF_MUSICPLAYER_DEVICE): _MEDIAPLAYER_SELECTOR,
         vol.Optional(CONF_INTENT_DEVICE, default=vol.UNDEFINED): EntitySelector(
-            EntitySelectorConfig(domain=SENSOR_DOMAIN)
+            EntitySelectorConfig(domain=Platform.SENSOR)
         ),
     }
 )
 
 
+def _get_registry_display_devices(hass: HomeAssistant) -> dict[str, str]:
+    """Get devices of supported display domains from the device registry.
+
+    Cached in hass.data while the integration is loaded, as setup clears the
+    cache whenever the device registry is updated.
+    """
+    hass_data = hass.data.setdefault(DOMAIN, {})
+    if (devices := hass_data.get(DISPLAY_DEVICES_CACHE)) is not None:
+        return devices
+
+    devices = {
+        device.id: device.name
+        for domain_devices in get_devices_for_domains(
+            hass, {BROWSERMOD_DOMAIN, REMOTE_ASSIST_DISPLAY_DOMAIN}
+        ).values()
+        for device in domain_devices
+    }
+    # Only cache if setup is listening for registry updates to clear it
+    if DISPLAY_DEVICES_CACHE in hass_data:
+        hass_data[DISPLAY_DEVICES_CACHE] = devices
+    return devices
+
+
 def get_display_devices(
     hass: HomeAssistant, config: VAConfigEntry | None = None
-) -> dict[str, Any]:
-    """Get display device options."""
-    domain_filters = [BROWSERMOD_DOMAIN, REMOTE_ASSIST_DISPLAY_DOMAIN]
-
+) -> tuple[tuple[str, str], ...]:
+    """Get display device (id, name) pairs as a hashable key for selectors."""
+    # Copy so registry and config devices are not added to the shared browser ids
     hass_data = hass.data.setdefault(DOMAIN, {})
-    display_devices: dict[str, Any] = hass_data.get("va_browser_ids", {})
+    display_devices: dict[str, Any] = dict(hass_data.get("va_browser_ids", {}))
 
     # Add suported domain devices
-    for domain in domain_filters:
-        domain_devices = get_devices_for_domain(hass, domain)
-        if domain_devices:
-            for device in domain_devices:
-                display_devices[device.id] = device.name
+    display_devices.update(_get_registry_display_devices(hass))
 
     # Add current setting if not already in list
     if config is not None:
-        attrs = [CONF_DISPLAY_DEVICE, CONF_DEVELOPER_DEVICE]
-        for attr in attrs:
+        for attr in _EXTRA_DEVICE_ATTRS:
             if d := config.data.get(attr):
-                if d not in display_devices:
-                    display_devices[d] = d
+                display_devices.setdefault(d, d)
+
+    return tuple(display_devices.items())
+
+
+def _as_option_list(items: tuple[tuple[str, str], ...]) -> list[dict[str, str]]:
+    """Return selector options for (value, label) pairs."""
+    return [{"value": value, "label": label} for value, label in items]
+
 
-    # Make into options dict
-    return [
+@lru_cache(maxsize=4)
+def _display_device_selector(
+    display_devices: tuple[tuple[str, str], ...],
+) -> SelectSelector:
+    """Return a display device selector for the display device options."""
+    return SelectSelector(
+        SelectSelectorConfig(
+            options=_as_option_list(display_devices),
+            mode=SelectSelectorMode.DROPDOWN,
+        )
+    )
+
+
+@lru_cache(maxsize=4)
+def _view_audio_schema(display_devices: tuple[tuple[str, str], ...]) -> vol.Schema:
+    """Return the device schema extended with a display device selector."""
+    return BASE_DEVICE_SCHEMA.extend(
         {
-            "value": key,
-            "label": value,
+            vol.Required(CONF_DISPLAY_DEVICE): _display_device_selector(
+                display_devices
+            )
         }
-        for key, value in display_devices.items()
-    ]
+    )
 
 
-async def get_dashboard_options_schema(
+def _get_view_audio_device_schema(
     hass: HomeAssistant, config_entry: VAConfigEntry | None
 ) -> vol.Schema:
-    """Return schema for dashboard options."""
-    is_master = (
-        config_entry is not None
-        and config_entry.data[CONF_TYPE] == VAType.MASTER_CONFIG
+    """Return device schema for a view audio device."""
+    return _view_audio_schema(get_display_devices(hass, config_entry))
+
+
+def _get_audio_only_device_schema(
+    hass: HomeAssistant, config_entry: VAConfigEntry | None
+) -> vol.Schema:
+    """Return device schema for an audio only device."""
+    return BASE_DEVICE_SCHEMA
+
+
+_DEVICE_SCHEMA_BY_TYPE = {
+    VAType.VIEW_AUDIO: _get_view_audio_device_schema,
+    VAType.AUDIO_ONLY: _get_audio_only_device_schema,
+}
+
+
+def get_device_schema(
+    hass: HomeAssistant, va_type: str, config_entry: VAConfigEntry | None = None
+) -> vol.Schema:
+    """Return device schema for the device type."""
+    return _DEVICE_SCHEMA_BY_TYPE.get(va_type, _get_audio_only_device_schema)(
+        hass, config_entry
     )
 
-    # Modify any option lists
-    if is_master:
-        background_source_options = [
-            e.value for e in VABackgroundMode if e != VABackgroundMode.LINKED
-        ]
-        background_extra = {}
-    else:
-        background_source_options = [e.value for e in VABackgroundMode]
-        background_extra = {
-            vol.Optional(CONF_ROTATE_BACKGROUND_LINKED_ENTITY): (
-                EntitySelector(
-                    EntitySelectorConfig(
-                        integration=DOMAIN,
-                        domain=SENSOR_DOMAIN,
-                        exclude_entities=[],
-                    )
-                )
-            )
-        }
 
-    # Get the overlay options
-    installed_dashboard = await hass.data[DOMAIN][ASSETS_MANAGER].get_installed_version(
-        AssetClass.DASHBOARD, "dashboard"
+# Static selectors used in options schemas
+_STATUS_ICON_SIZE_SELECTOR = SelectSelector(
+    SelectSelectorConfig(
+        translation_key="status_icons_size_selector",
+        options=list(VAIconSizes.VALUES),
+        mode=SelectSelectorMode.DROPDOWN,
     )
-    if AwesomeVersion(installed_dashboard) >= MIN_DASHBOARD_FOR_OVERLAYS:
-        available_overlays = await hass.async_add_executor_job(
-            get_available_overlays, hass
-        )
-        _LOGGER.debug("Overlay options: %s", available_overlays)
-        overlay_options = [
-            {"value": key, "label": value} for key, value in available_overlays.items()
-        ]
-    else:
-        _LOGGER.debug("No overlays available, using default options")
-        overlay_options = [e.value for e in VAAssistPrompt]
-
-    BASE = {
-        vol.Optional(CONF_DASHBOARD): str,
-        vol.Optional(CONF_HOME): str,
-        vol.Optional(CONF_MUSIC): str,
-        vol.Optional(CONF_INTENT): str,
-        vol.Optional(CONF_LIST): str,
-    }
-    BACKGROUND_SETTINGS = {
+)
+_STATUS_ICONS_SELECTOR = SelectSelector(
+    SelectSelectorConfig(
+        translation_key="status_icons_selector",
+        options=[],
+        mode=SelectSelectorMode.LIST,
+        multiple=True,
+        custom_value=True,
+    )
+)
+_MENU_ITEMS_SELECTOR = SelectSelector(
+    SelectSelectorConfig(
+        translation_key="menu_icons_selector",
+        options=[],
+        mode=SelectSelectorMode.LIST,
+        multiple=True,
+        custom_value=True,
+    )
+)
+_MENU_CONFIG_SELECTOR = SelectSelector(
+    SelectSelectorConfig(
+        translation_key="menu_config_selector",
+        options=list(VAMenuConfig.VALUES),
+        mode=SelectSelectorMode.DROPDOWN,
+    )
+)
+_TIME_FORMAT_SELECTOR = SelectSelector(
+    SelectSelectorConfig(
+        options=list(VATimeFormat.VALUES),
+        mode=SelectSelectorMode.DROPDOWN,
+        translation_key="lookup_selector",
+    )
+)
+_SCREEN_MODE_SELECTOR = SelectSelector(
+    SelectSelectorConfig(
+        options=list(VAScreenMode.VALUES),
+        mode=SelectSelectorMode.DROPDOWN,
+        translation_key="lookup_selector",
+    )
+)
+_ONOFF_SELECTOR = SelectSelector(
+    SelectSelectorConfig(
+        options=["on", "off"],
+        mode=SelectSelectorMode.DROPDOWN,
+        translation_key="lookup_selector",
+    )
+)
+_ASSIST_PROMPT_SELECTOR_DEFAULT = SelectSelector(
+    SelectSelectorConfig(
+        translation_key="assist_prompt_selector",
+        options=list(VAAssistPrompt.VALUES),
+        mode=SelectSelectorMode.DROPDOWN,
+    )
+)
+_DEVELOPER_MIMIC_SELECTOR = EntitySelector(
+    EntitySelectorConfig(integration=DOMAIN, domain=Platform.SENSOR)
+)
+
+# Dashboard and view path options, all free text
+_DASHBOARD_PATH_FIELDS = (CONF_DASHBOARD, CONF_HOME, CONF_MUSIC, CONF_INTENT, CONF_LIST)
+_DASHBOARD_PATH_SCHEMA = {vol.Optional(key): str for key in _DASHBOARD_PATH_FIELDS}
+
+# Display settings after the assist prompt, which depends on available overlays
+_DISPLAY_SETTINGS_FIELDS = {
+    vol.Optional(CONF_FONT_STYLE): str,
+    vol.Optional(CONF_STATUS_ICON_SIZE): _STATUS_ICON_SIZE_SELECTOR,
+    vol.Optional(CONF_STATUS_ICONS): _STATUS_ICONS_SELECTOR,
+    vol.Optional(CONF_MENU_CONFIG): _MENU_CONFIG_SELECTOR,
+    vol.Optional(CONF_MENU_ITEMS): _MENU_ITEMS_SELECTOR,
+    vol.Optional(CONF_MENU_TIMEOUT): int,
+    vol.Optional(CONF_TIME_FORMAT): _TIME_FORMAT_SELECTOR,
+    vol.Optional(CONF_SCREEN_MODE): _SCREEN_MODE_SELECTOR,
+}
+
+_MIN_OVERLAY_VERSION = AwesomeVersion(MIN_DASHBOARD_FOR_OVERLAYS)
+
+
+def _build_background_settings_section(is_master: bool) -> section:
+    """Build the background settings section.
+
+    Linking the background to another entity is not available on the master config.
+    """
+    background_settings = {
         vol.Optional(CONF_BACKGROUND_MODE): SelectSelector(
             SelectSelectorConfig(
                 translation_key="rotate_backgound_source_selector",
-                options=background_source_options,
+                options=list(
+                    VABackgroundMode.NON_LINKED_VALUES
+                    if is_master
+                    else VABackgroundMode.VALUES
+                ),
                 mode=SelectSelectorMode.DROPDOWN,
             )
         ),
@@ -232,107 +350,162 @@ async def get_dashboard_options_schema(
         vol.Optional(CONF_ROTATE_BACKGROUND_PATH): str,
         vol.Optional(CONF_ROTATE_BACKGROUND_INTERVAL): int,
     }
-
-    DISPLAY_SETTINGS = {
-        vol.Optional(CONF_ASSIST_PROMPT): SelectSelector(
-            SelectSelectorConfig(
-                translation_key="assist_prompt_selector",
-                options=overlay_options,
-                mode=SelectSelectorMode.DROPDOWN,
-            )
-        ),
-        vol.Optional(CONF_FONT_STYLE): str,
-        vol.Optional(CONF_STATUS_ICON_SIZE): SelectSelector(
-            SelectSelectorConfig(
-                translation_key="status_icons_size_selector",
-                options=[e.value for e in VAIconSizes],
-                mode=SelectSelectorMode.DROPDOWN,
-            )
-        ),
-        vol.Optional(CONF_STATUS_ICONS): SelectSelector(
-            SelectSelectorConfig(
-                translation_key="status_icons_selector",
-                options=[],
-                mode=SelectSelectorMode.LIST,
-                multiple=True,
-                custom_value=True,
-            )
-        ),
-        vol.Optional(CONF_MENU_CONFIG): SelectSelector(
-            SelectSelectorConfig(
-                translation_key="menu_config_selector",
-                options=[e.value for e in VAMenuConfig],
-                mode=SelectSelectorMode.DROPDOWN,
+    if not is_master:
+        background_settings[vol.Optional(CONF_ROTATE_BACKGROUND_LINKED_ENTITY)] = (
+            EntitySelector(
+                EntitySelectorConfig(
+                    integration=DOMAIN,
+                    domain=Platform.SENSOR,
+                    exclude_entities=[],
+                )
             )
-        ),
-        vol.Optional(CONF_MENU_ITEMS): SelectSelector(
-            SelectSelectorConfig(
-                translation_key="menu_icons_selector",
-                options=[],
-                mode=SelectSelectorMode.LIST,
-                multiple=True,
-                custom_value=True,
+        )
+    return section(
+        vol.Schema(background_settings), options=SectionConfig(collapsed=True)
+    )
+
+
+# Background settings sections by is_master
+_BACKGROUND_SETTINGS_SECTIONS = {
+    True: _build_background_settings_section(True),
+    False: _build_background_settings_section(False),
+}
+
+
+async def get_dashboard_options_schema(
+    hass: HomeAssistant, config_entry: VAConfigEntry | None
+) -> vol.Schema:
+    """Return schema for dashboard options."""
+    is_master = (
+        config_entry is not None
+        and config_entry.data[CONF_TYPE] == VAType.MASTER_CONFIG
+    )
+
+    return _build_dashboard_options_schema(
+        is_master, await _async_get_overlay_key(hass)
+    )
+
+
+def _copy_sections(schema: vol.Schema) -> vol.Schema:
+    """Return schema with its sections copied.
+
+    Applying suggested values can replace the schema of a section, so cached
+    schemas must not have their sections shared with a form.
+    """
+    return vol.Schema(
+        {
+            key: section(value.schema, value.options)
+            if isinstance(value, section)
+            else value
+            for key, value in schema.schema.items()
+        }
+    )
+
+
+@lru_cache(maxsize=8)
+def _overlays_supported(dashboard_version: str) -> bool:
+    """Return if the dashboard version supports overlays."""
+    return AwesomeVersion(dashboard_version) >= _MIN_OVERLAY_VERSION
+
+
+def _get_overlay_file_key(hass: HomeAssistant) -> tuple[int, int] | None:
+    """Return overlay file mtime and size to detect changes, None if not found."""
+    try:
+        stat = Path(
+            hass.config.path(DOMAIN, DASHBOARD_DIR, f"{OVERLAY_FILE_NAME}.html")
+        ).stat()
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+async def _async_get_overlay_key(
+    hass: HomeAssistant,
+) -> tuple[tuple[str, str], ...] | None:
+    """Return the available overlays as a hashable key or None if not supported."""
+    installed_dashboard = await hass.data[DOMAIN][ASSETS_MANAGER].get_installed_version(
+        AssetClass.DASHBOARD, "dashboard"
+    )
+    if _overlays_supported(installed_dashboard):
+        # Reparse overlays if the dashboard version or the overlay file changes
+        file_key = await hass.async_add_executor_job(_get_overlay_file_key, hass)
+        cache_key = (installed_dashboard, file_key)
+        cached = hass.data[DOMAIN].get(OVERLAYS_CACHE)
+        if cached is None or cached[0] != cache_key:
+            available_overlays = await hass.async_add_executor_job(
+                get_available_overlays, hass
             )
-        ),
-        vol.Optional(CONF_MENU_TIMEOUT): int,
-        vol.Optional(CONF_TIME_FORMAT): SelectSelector(
+            _LOGGER.debug("Overlay options: %s", available_overlays)
+            cached = (cache_key, tuple(sorted(available_overlays.items())))
+            hass.data[DOMAIN][OVERLAYS_CACHE] = cached
+        return cached[1]
+
+    _LOGGER.debug("No overlays available, using default options")
+    return None
+
+
+@lru_cache(maxsize=8)
+def _build_dashboard_options_schema(
+    is_master: bool, overlays: tuple[tuple[str, str], ...] | None
+) -> vol.Schema:
+    """Build schema for dashboard options.
+
+    Cached as the schema only varies by entry type and available overlays.  As
+    the overlays form part of the key, a dashboard update that changes them
+    results in a new schema without needing to clear the cache.
+    """
+    # Only build an assist prompt selector if using overlays
+    if overlays is not None:
+        assist_prompt_selector = SelectSelector(
             SelectSelectorConfig(
-                options=[e.value for e in VATimeFormat],
+                translation_key="assist_prompt_selector",
+                options=_as_option_list(overlays),
                 mode=SelectSelectorMode.DROPDOWN,
-                translation_key="lookup_selector",
             )
+        )
+    else:
+        assist_prompt_selector = _ASSIST_PROMPT_SELECTOR_DEFAULT
+
+    schema = dict(_DASHBOARD_PATH_SCHEMA)
+    schema[vol.Required(CONF_BACKGROUND_SETTINGS)] = _BACKGROUND_SETTINGS_SECTIONS[
+        is_master
+    ]
+    schema[vol.Required(CONF_DISPLAY_SETTINGS)] = section(
+        vol.Schema(
+            {vol.Optional(CONF_ASSIST_PROMPT): assist_prompt_selector}
+            | _DISPLAY_SETTINGS_FIELDS
         ),
-        vol.Optional(CONF_SCREEN_MODE): SelectSelector(
+        options=SectionConfig(collapsed=True),
+    )
+    return vol.Schema(schema)
+
+
+TYPE_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_TYPE, default=DEFAULT_TYPE): SelectSelector(
             SelectSelectorConfig(
-                options=[e.value for e in VAScreenMode],
+                translation_key="type_selector",
+                options=list(VAType.NON_MASTER_VALUES),
                 mode=SelectSelectorMode.DROPDOWN,
-                translation_key="lookup_selector",
             )
         ),
     }
+)
 
-    BACKGROUND_SETTINGS.update(background_extra)
-
-    schema = BASE
-    schema[vol.Required(CONF_BACKGROUND_SETTINGS)] = section(
-        vol.Schema(BACKGROUND_SETTINGS), options=SectionConfig(collapsed=True)
-    )
-    schema[vol.Required(CONF_DISPLAY_SETTINGS)] = section(
-        vol.Schema(DISPLAY_SETTINGS), options=SectionConfig(collapsed=True)
-    )
-    return vol.Schema(schema)
-
+MASTER_CONFIG_SCHEMA = vol.Schema({})
 
 DEFAULT_OPTIONS_SCHEMA = vol.Schema(
     {
         vol.Optional(CONF_WEATHER_ENTITY): EntitySelector(
-            EntitySelectorConfig(domain=WEATHER_DOMAIN)
+            EntitySelectorConfig(domain=Platform.WEATHER)
         ),
         vol.Optional(CONF_MODE): str,
         vol.Optional(CONF_VIEW_TIMEOUT): NumberSelector(
             NumberSelectorConfig(min=5, max=999, mode=NumberSelectorMode.BOX)
         ),
-        vol.Optional(CONF_DO_NOT_DISTURB): SelectSelector(
-            SelectSelectorConfig(
-                options=["on", "off"],
-                mode=SelectSelectorMode.DROPDOWN,
-                translation_key="lookup_selector",
-            )
-        ),
-        vol.Optional(CONF_USE_ANNOUNCE): SelectSelector(
-            SelectSelectorConfig(
-                options=["on", "off"],
-                mode=SelectSelectorMode.DROPDOWN,
-                translation_key="lookup_selector",
-            )
-        ),
-        vol.Optional(CONF_MIC_UNMUTE): SelectSelector(
-            SelectSelectorConfig(
-                options=["on", "off"],
-                mode=SelectSelectorMode.DROPDOWN,
-                translation_key="lookup_selector",
-            )
-        ),
+        vol.Optional(CONF_DO_NOT_DISTURB): _ONOFF_SELECTOR,
+        vol.Optional(CONF_USE_ANNOUNCE): _ONOFF_SELECTOR,
+        vol.Optional(CONF_MIC_UNMUTE): _ONOFF_SELECTOR,
         vol.Optional(CONF_DUCKING_VOLUME): NumberSelector(
             NumberSelectorConfig(
                 min=0,
@@ -352,29 +525,50 @@ INTEGRATION_OPTIONS_SCHEMA = vol.Schema(
 def get_developer_options_schema(
     hass: HomeAssistant, config_entry: VAConfigEntry | None
 ) -> vol.Schema:
-    """Return schema for dashboard options."""
+    """Return schema for developer options."""
+    return _developer_options_schema(get_display_devices(hass, config_entry))
+
+
+@lru_cache(maxsize=4)
+def _developer_options_schema(
+    display_devices: tuple[tuple[str, str], ...],
+) -> vol.Schema:
+    """Build schema for developer options."""
     return vol.Schema(
         {
-            vol.Optional(CONF_DEVELOPER_DEVICE): SelectSelector(
-                SelectSelectorConfig(
-                    options=get_display_devices(hass, config_entry),
-                    mode=SelectSelectorMode.DROPDOWN,
-                )
-            ),
-            vol.Optional(CONF_DEVELOPER_MIMIC_DEVICE): EntitySelector(
-                EntitySelectorConfig(integration=DOMAIN, domain=Platform.SENSOR)
+            vol.Optional(CONF_DEVELOPER_DEVICE): _display_device_selector(
+                display_devices
             ),
+            vol.Optional(CONF_DEVELOPER_MIMIC_DEVICE): _DEVELOPER_MIMIC_SELECTOR,
         }
     )
 
 
-def get_suggested_option_values(config: VAConfigEntry) -> dict[str, Any]:
+def get_suggested_option_values(
+    hass: HomeAssistant, config: VAConfigEntry
+) -> dict[str, Any]:
     """Get suggested values for the config entry."""
     if config.data[CONF_TYPE] == VAType.MASTER_CONFIG:
-        option_values = DEFAULT_VALUES.copy()
-        for option in DEFAULT_VALUES:
-            if config.options.get(option) is not None:
-                option_values[option] = config.options.get(option)
+        # Values by entry id with the options they were built from, removed on
+        # unload.  Options are replaced, not mutated, on update so identity
+        # shows a change
+        values_cache: dict[str, tuple[Mapping[str, Any], dict[str, Any]]] = (
+            hass.data.setdefault(DOMAIN, {}).setdefault(SUGGESTED_VALUES_CACHE, {})
+        )
+        cached = values_cache.get(config.entry_id)
+        if cached is not None and cached[0] is config.options:
+            return cached[1]
+
+        # Unwrap read only default sections so they serialise to the frontend
+        option_values = {
+            option: dict(value) if isinstance(value, Mapping) else value
+            for option, value in DEFAULT_VALUES.items()
+        } | {
+            option: value
+            for option, value in config.options.items()
+            if value is not None and option in DEFAULT_VALUES
+        }
+        values_cache[config.entry_id] = (config.options, option_values)
         return option_values
     return config.options
 
@@ -411,19 +605,7 @@ class ViewAssistConfigFlow(ConfigFlow, domain=DOMAIN):
             return self.async_show_form(
                 step_id="user",
                 last_step=False,
-                data_schema=vol.Schema(
-                    {
-                        vol.Required(CONF_TYPE, default=DEFAULT_TYPE): SelectSelector(
-                            SelectSelectorConfig(
-                                translation_key="type_selector",
-                                options=[
-                                    e.value for e in VAType if e != VAType.MASTER_CONFIG
-                                ],
-                                mode=SelectSelectorMode.DROPDOWN,
-                            )
-                        ),
-                    }
-                ),
+                data_schema=TYPE_SCHEMA,
             )
 
         return self.async_show_form(step_id="master_config", last_step=True)
@@ -452,19 +634,7 @@ class ViewAssistConfigFlow(ConfigFlow, domain=DOMAIN):
             )
 
         # Define the schema based on the selected type
-        if self.type == VAType.VIEW_AUDIO:
-            data_schema = BASE_DEVICE_SCHEMA.extend(
-                {
-                    vol.Required(CONF_DISPLAY_DEVICE): SelectSelector(
-                        SelectSelectorConfig(
-                            options=get_display_devices(self.hass),
-                            mode=SelectSelectorMode.DROPDOWN,
-                        )
-                    )
-                }
-            )
-        else:  # audio_only
-            data_schema = BASE_DEVICE_SCHEMA
+        data_schema = get_device_schema(self.hass, self.type)
 
         # Show the form for the selected type
         return self.async_show_form(step_id="options", data_schema=data_schema)
@@ -477,7 +647,7 @@ class ViewAssistConfigFlow(ConfigFlow, domain=DOMAIN):
             )
         return self.async_show_form(
             step_id="master_config",
-            data_schema=vol.Schema({}),
+            data_schema=MASTER_CONFIG_SCHEMA,
         )
 
 
@@ -488,6 +658,35 @@ class ViewAssistOptionsFlowHandler(OptionsFlow):
     and show how to use api data to populate a selector.
     """
 
+    def __init__(self) -> None:
+        """Initialise."""
+        super().__init__()
+        self._dashboard_schema: tuple[vol.Schema, vol.Schema] | None = None
+        self._form_description: str | None = None
+
+    @cached_property
+    def va_type(self) -> str:
+        """Return the entry type.
+
+        The config entry is not available in __init__, so read on first use.
+        """
+        return self.config_entry.data[CONF_TYPE]
+
+    def _apply_user_input(
+        self, data_schema: vol.Schema, user_input: dict[str, Any]
+    ) -> dict[str, Any]:
+        """Merge form input into the entry options.
+
+        Fields cleared on the form are missing from user_input, so are removed.
+        """
+        schema_keys = {getattr(key, "schema", key) for key in data_schema.schema}
+        keys_to_clear = schema_keys - user_input.keys()
+        options = {
+            k: v for k, v in self.config_entry.options.items() if k not in keys_to_clear
+        }
+        options.update(user_input)
+        return options
+
     async def async_step_init(self, user_input=None):
         """Handle options flow."""
 
@@ -495,7 +694,11 @@ class ViewAssistOptionsFlowHandler(OptionsFlow):
         # Display reconfigure form if audio only
 
         # Also need to be in strings.json and translation files.
-        self.va_type = self.config_entry.data[CONF_TYPE]  # pylint: disable=attribute-defined-outside-init
+        self._form_description = (
+            MASTER_FORM_DESCRIPTION
+            if self.va_type == VAType.MASTER_CONFIG
+            else DEVICE_FORM_DESCRIPTION
+        )
 
         if self.va_type == VAType.VIEW_AUDIO:
             return self.async_show_menu(
@@ -517,55 +720,46 @@ class ViewAssistOptionsFlowHandler(OptionsFlow):
 
     async def async_step_main_config(self, user_input=None):
         """Handle main config flow."""
+        # config_entry is looked up from the config entries on each access
+        config_entry = self.config_entry
 
         if user_input is not None:
             # This is just updating the core config so update config_entry.data
             user_input[CONF_TYPE] = self.va_type
-            self.hass.config_entries.async_update_entry(
-                self.config_entry, data=user_input
-            )
+            self.hass.config_entries.async_update_entry(config_entry, data=user_input)
             return self.async_create_entry(data=None)
 
-        if self.va_type == VAType.VIEW_AUDIO:
-            data_schema = BASE_DEVICE_SCHEMA.extend(
-                {
-                    vol.Required(CONF_DISPLAY_DEVICE): SelectSelector(
-                        SelectSelectorConfig(
-                            options=get_display_devices(self.hass, self.config_entry),
-                            mode=SelectSelectorMode.DROPDOWN,
-                        )
-                    )
-                }
-            )
-            data_schema = self.add_suggested_values_to_schema(
-                data_schema, self.config_entry.data
-            )
-        else:  # audio_only
-            data_schema = self.add_suggested_values_to_schema(
-                BASE_DEVICE_SCHEMA, self.config_entry.data
-            )
+        data_schema = self.add_suggested_values_to_schema(
+            get_device_schema(self.hass, self.va_type, config_entry),
+            config_entry.data,
+        )
 
         # Show the form for the selected type
         return self.async_show_form(
             step_id="main_config",
             data_schema=data_schema,
-            description_placeholders={"name": self.config_entry.title},
+            description_placeholders={"name": config_entry.title},
         )
 
     async def async_step_dashboard_options(self, user_input=None):
         """Handle dashboard options flow."""
-        data_schema = self.add_suggested_values_to_schema(
-            await get_dashboard_options_schema(self.hass, self.config_entry),
-            get_suggested_option_values(self.config_entry),
-        )
+        # Reuse the form schema for this session while the base schema is unchanged
+        schema = await get_dashboard_options_schema(self.hass, self.config_entry)
+        if self._dashboard_schema is None or self._dashboard_schema[0] is not schema:
+            self._dashboard_schema = (
+                schema,
+                self.add_suggested_values_to_schema(
+                    _copy_sections(schema),
+                    get_suggested_option_values(self.hass, self.config_entry),
+                ),
+            )
+        data_schema = self._dashboard_schema[1]
 
         if user_input is not None:
             # This is just updating the core config so update config_entry.data
-            options = self.config_entry.options | user_input
-            for o in data_schema.schema:
-                if o not in user_input:
-                    options.pop(o, None)
-            return self.async_create_entry(data=options)
+            return self.async_create_entry(
+                data=self._apply_user_input(data_schema, user_input)
+            )
 
         # Show the form
         return self.async_show_form(
@@ -573,9 +767,7 @@ class ViewAssistOptionsFlowHandler(OptionsFlow):
             data_schema=data_schema,
             description_placeholders={
                 "name": self.config_entry.title,
-                "description": MASTER_FORM_DESCRIPTION
-                if self.config_entry.data[CONF_TYPE] == VAType.MASTER_CONFIG
-                else DEVICE_FORM_DESCRIPTION,
+                "description": self._form_description,
             },
         )
 
@@ -583,16 +775,15 @@ class ViewAssistOptionsFlowHandler(OptionsFlow):
         """Handle default options flow."""
 
         data_schema = self.add_suggested_values_to_schema(
-            DEFAULT_OPTIONS_SCHEMA, get_suggested_option_values(self.config_entry)
+            DEFAULT_OPTIONS_SCHEMA,
+            get_suggested_option_values(self.hass, self.config_entry),
         )
 
         if user_input is not None:
             # This is just updating the core config so update config_entry.data
-            options = self.config_entry.options | user_input
-            for o in data_schema.schema:
-                if o not in user_input:
-                    options.pop(o, None)
-            return self.async_create_entry(data=options)
+            return self.async_create_entry(
+                data=self._apply_user_input(data_schema, user_input)
+            )
 
         # Show the form
         return self.async_show_form(
@@ -600,9 +791,7 @@ class ViewAssistOptionsFlowHandler(OptionsFlow):
             data_schema=data_schema,
             description_placeholders={
                 "name": self.config_entry.title,
-                "description": MASTER_FORM_DESCRIPTION
-                if self.config_entry.data[CONF_TYPE] == VAType.MASTER_CONFIG
-                else DEVICE_FORM_DESCRIPTION,
+                "description": self._form_description,
             },
         )
 
@@ -611,16 +800,14 @@ class ViewAssistOptionsFlowHandler(OptionsFlow):
 
         data_schema = self.add_suggested_values_to_schema(
             INTEGRATION_OPTIONS_SCHEMA,
-            get_suggested_option_values(self.config_entry),
+            get_suggested_option_values(self.hass, self.config_entry),
         )
 
         if user_input is not None:
             # This is just updating the core config so update config_entry.data
-            options = self.config_entry.options | user_input
-            for o in data_schema.schema:
-                if o not in user_input:
-                    options.pop(o, None)
-            return self.async_create_entry(data=options)
+            return self.async_create_entry(
+                data=self._apply_user_input(data_schema, user_input)
+            )
 
         # Show the form
         return self.async_show_form(
@@ -634,16 +821,14 @@ class ViewAssistOptionsFlowHandler(OptionsFlow):
 
         data_schema = self.add_suggested_values_to_schema(
             get_developer_options_schema(self.hass, self.config_entry),
-            get_suggested_option_values(self.config_entry),
+            get_suggested_option_values(self.hass, self.config_entry),
         )
 
         if user_input is not None:
             # This is just updating the core config so update config_entry.data
-            options = self.config_entry.options | user_input
-            for o in data_schema.schema:
-                if o not in user_input:
-                    options.pop(o, None)
-            return self.async_create_entry(data=options)
+            return self.async_create_entry(
+                data=self._apply_user_input(data_schema, user_input)
+            )
 
         # Show the form
         return self.async_show_form(
@@ -1,6 +1,7 @@
 """Integration classes and constants."""
 
 from enum import StrEnum
+from types import MappingProxyType
 
 from homeassistant.const import CONF_MODE
 
@@ -26,7 +27,7 @@ DASHBOARD_NAME = "View Assist"
 WIKI_URL = "https://dinki.github.io/View-Assist"
 
 DEFAULT_VIEW = "clock"
-CYCLE_VIEWS = ["music", "info", "weather", "clock"]
+CYCLE_VIEWS = ("music", "info", "weather", "clock")
 
 BROWSERMOD_DOMAIN = "browser_mod"
 REMOTE_ASSIST_DISPLAY_DOMAIN = "remote_assist_display"
@@ -124,45 +125,52 @@ CONF_ROTATE_BACKGROUND = "rotate_background"
 CONF_ROTATE_BACKGROUND_SOURCE = "rotate_background_source"
 
 
-DEFAULT_VALUES = {
-    # Dashboard options
-    CONF_DASHBOARD: "/view-assist",
-    CONF_HOME: "/view-assist/clock",
-    CONF_MUSIC: "/view-assist/music",
-    CONF_INTENT: "/view-assist/intent",
-    CONF_LIST: "/view-assist/list",
-    CONF_BACKGROUND_SETTINGS: {
-        CONF_BACKGROUND_MODE: VABackgroundMode.DEFAULT_BACKGROUND,
-        CONF_BACKGROUND: "/view_assist/dashboard/background.jpg",
-        CONF_ROTATE_BACKGROUND_PATH: f"{IMAGE_PATH}/backgrounds",
-        CONF_ROTATE_BACKGROUND_LINKED_ENTITY: "",
-        CONF_ROTATE_BACKGROUND_INTERVAL: 60,
-    },
-    CONF_DISPLAY_SETTINGS: {
-        CONF_ASSIST_PROMPT: "blur_pop_up",
-        CONF_STATUS_ICON_SIZE: VAIconSizes.LARGE,
-        CONF_FONT_STYLE: "Roboto",
-        CONF_STATUS_ICONS: [],
-        CONF_MENU_CONFIG: VAMenuConfig.DISABLED,
-        CONF_MENU_ITEMS: ["home", "weather"],
-        CONF_MENU_TIMEOUT: 10,
-        CONF_TIME_FORMAT: VATimeFormat.HOUR_12,
-        CONF_SCREEN_MODE: VAScreenMode.HIDE_HEADER_SIDEBAR,
-    },
-    # Default options
-    CONF_WEATHER_ENTITY: "weather.home",
-    CONF_MODE: VAMode.NORMAL,
-    CONF_VIEW_TIMEOUT: 20,
-    CONF_DO_NOT_DISTURB: "off",
-    CONF_USE_ANNOUNCE: "off",
-    CONF_MIC_UNMUTE: "off",
-    CONF_DUCKING_VOLUME: 70,
-    # Default integration options
-    CONF_ENABLE_UPDATES: True,
-    # Default developer otions
-    CONF_DEVELOPER_DEVICE: "",
-    CONF_DEVELOPER_MIMIC_DEVICE: "",
-}
+# Read only, so callers needing to modify a default must copy it
+DEFAULT_VALUES = MappingProxyType(
+    {
+        # Dashboard options
+        CONF_DASHBOARD: "/view-assist",
+        CONF_HOME: "/view-assist/clock",
+        CONF_MUSIC: "/view-assist/music",
+        CONF_INTENT: "/view-assist/intent",
+        CONF_LIST: "/view-assist/list",
+        CONF_BACKGROUND_SETTINGS: MappingProxyType(
+            {
+                CONF_BACKGROUND_MODE: VABackgroundMode.DEFAULT_BACKGROUND,
+                CONF_BACKGROUND: "/view_assist/dashboard/background.jpg",
+                CONF_ROTATE_BACKGROUND_PATH: f"{IMAGE_PATH}/backgrounds",
+                CONF_ROTATE_BACKGROUND_LINKED_ENTITY: "",
+                CONF_ROTATE_BACKGROUND_INTERVAL: 60,
+            }
+        ),
+        CONF_DISPLAY_SETTINGS: MappingProxyType(
+            {
+                CONF_ASSIST_PROMPT: "blur_pop_up",
+                CONF_STATUS_ICON_SIZE: VAIconSizes.LARGE,
+                CONF_FONT_STYLE: "Roboto",
+                CONF_STATUS_ICONS: (),
+                CONF_MENU_CONFIG: VAMenuConfig.DISABLED,
+                CONF_MENU_ITEMS: ("home", "weather"),
+                CONF_MENU_TIMEOUT: 10,
+                CONF_TIME_FORMAT: VATimeFormat.HOUR_12,
+                CONF_SCREEN_MODE: VAScreenMode.HIDE_HEADER_SIDEBAR,
+            }
+        ),
+        # Default options
+        CONF_WEATHER_ENTITY: "weather.home",
+        CONF_MODE: VAMode.NORMAL,
+        CONF_VIEW_TIMEOUT: 20,
+        CONF_DO_NOT_DISTURB: "off",
+        CONF_USE_ANNOUNCE: "off",
+        CONF_MIC_UNMUTE: "off",
+        CONF_DUCKING_VOLUME: 70,
+        # Default integration options
+        CONF_ENABLE_UPDATES: True,
+        # Default developer otions
+        CONF_DEVELOPER_DEVICE: "",
+        CONF_DEVELOPER_MIMIC_DEVICE: "",
+    }
+)
 
 # Config default values
 DEFAULT_NAME = "View Assist"
@@ -197,15 +205,25 @@ CC_CONVERSATION_ENDED_EVENT = f"{CUSTOM_CONVERSATION_DOMAIN}_conversation_ended"
 
 
 # TODO: Remove this when BP/Views updated
-OPTION_KEY_MIGRATIONS = {
-    "blur pop up": "blur_pop_up",
-    "flashing bar": "flashing_bar",
-    "Home Assistant Voice Satellite": "home_assistant_voice_satellite",
-    "HassMic": "hassmic",
-    "Stream Assist": "stream_assist",
-    "BrowserMod": "browser_mod",
-    "Remote Assist Display": "remote_assist_display",
-}
+OPTION_KEY_MIGRATIONS = MappingProxyType(
+    {
+        "blur pop up": "blur_pop_up",
+        "flashing bar": "flashing_bar",
+        "Home Assistant Voice Satellite": "home_assistant_voice_satellite",
+        "HassMic": "hassmic",
+        "Stream Assist": "stream_assist",
+        "BrowserMod": "browser_mod",
+        "Remote Assist Display": "remote_assist_display",
+    }
+)
+# New option key to original option key
+OPTION_KEY_ORIGINALS = MappingProxyType(
+    {value: key for key, value in OPTION_KEY_MIGRATIONS.items()}
+)
 
 OVERLAY_FILE_NAME = "overlay"
+OVERLAYS_CACHE = "overlays_cache"
 MIN_DASHBOARD_FOR_OVERLAYS = "1.1.0"
+
+DISPLAY_DEVICES_CACHE = "display_devices_cache"
+SUGGESTED_VALUES_CACHE = "suggested_values_cache"
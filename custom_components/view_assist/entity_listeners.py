@@ -2,6 +2,7 @@
 
 import asyncio
 from asyncio import Task
+from collections.abc import Sequence
 from datetime import datetime as dt
 import logging
 import random
@@ -356,7 +357,7 @@ class EntityListeners:
                 self._display_revert_delay(revert_path, timeout)
             )
 
-    async def async_cycle_display_view(self, views: list[str]):
+    async def async_cycle_display_view(self, views: Sequence[str]):
         """Cycle display."""
 
         view_index = 0
@@ -1,6 +1,7 @@
 """Helper functions."""
 
 from bs4 import BeautifulSoup
+from collections.abc import Mapping
 from functools import reduce
 import logging
 from pathlib import Path
@@ -225,6 +226,13 @@ def get_devices_for_domain(hass: HomeAssistant, domain: str) -> list[dr.DeviceEn
     return []
 
 
+def get_devices_for_domains(
+    hass: HomeAssistant, domains: set[str]
+) -> dict[str, list[dr.DeviceEntry]]:
+    """Get all devices for each of the domains."""
+    return {domain: get_devices_for_domain(hass, domain) for domain in domains}
+
+
 def get_device_id_from_name(hass: HomeAssistant, device_name: str) -> str:
     """Get the device id of the device with the given name."""
 
@@ -381,11 +389,15 @@ def get_display_type_from_browser_id(
     return "native"
 
 
+_REVERT_SETTINGS_BY_MODE: dict[str, tuple[bool, str | None]] = {
+    mode: (settings.get("revert"), settings.get("view"))
+    for mode, settings in VAMODE_REVERTS.items()
+}
+
+
 def get_revert_settings_for_mode(mode: VAMode) -> tuple:
     """Get revert settings from VAMODE_REVERTS for mode."""
-    if mode in VAMODE_REVERTS:
-        return VAMODE_REVERTS[mode].get("revert"), VAMODE_REVERTS[mode].get("view")
-    return False, None
+    return _REVERT_SETTINGS_BY_MODE.get(mode, (False, None))
 
 
 def get_assist_satellite_entity_id_from_device_id(
@@ -430,7 +442,7 @@ def get_entities_by_attr_filter(
 
 
 def get_key(
-    dot_notation_path: str, data: dict
+    dot_notation_path: str, data: Mapping
 ) -> dict[str, dict | str | int] | str | int:
     """Try to get a deep value from a dict based on a dot-notation."""
 
@@ -439,8 +451,8 @@ def get_key(
             dn_list = dot_notation_path.split(".")
         else:
             dn_list = [dot_notation_path]
-        return reduce(dict.get, dn_list, data)
-    except (TypeError, KeyError):
+        return reduce(lambda d, k: d.get(k), dn_list, data)
+    except (AttributeError, TypeError, KeyError):
         return None
 
 
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import asyncio
+from collections.abc import Mapping
 from dataclasses import dataclass, field
 import logging
 from typing import Any
@@ -237,18 +238,20 @@ class MenuManager:
                 ):
                     return master_config.options[section][setting]
 
-        # Check defaults
+        # Check defaults, copying list defaults as they are stored as tuples
         if key in DEFAULT_VALUES:
-            return DEFAULT_VALUES[key]
+            value = DEFAULT_VALUES[key]
+            return list(value) if isinstance(value, tuple) else value
 
         if "." in key:
             section, setting = key.split(".")
             if (
                 section in DEFAULT_VALUES
-                and isinstance(DEFAULT_VALUES[section], dict)
+                and isinstance(DEFAULT_VALUES[section], Mapping)
                 and setting in DEFAULT_VALUES[section]
             ):
-                return DEFAULT_VALUES[section][setting]
+                value = DEFAULT_VALUES[section][setting]
+                return list(value) if isinstance(value, tuple) else value
 
         return default
 
@@ -15,7 +15,7 @@ from homeassistant.helpers.dispatcher import async_dispatcher_connect
 
 from .const import (
     DOMAIN,
-    OPTION_KEY_MIGRATIONS,
+    OPTION_KEY_ORIGINALS,
     VA_ATTRIBUTE_UPDATE_EVENT,
     VA_BACKGROUND_UPDATE_EVENT,
 )
@@ -57,6 +57,10 @@ class ViewAssistSensor(SensorEntity):
         self._attr_unique_id = f"{self._attr_name}_vasensor"
         self._attr_native_value = ""
         self._attribute_listeners: dict[str, Callable] = {}
+        self._attribute_update_event = VA_ATTRIBUTE_UPDATE_EVENT.format(
+            config.entry_id
+        )
+        self._background_update_event: str | None = None
 
         self._voice_device_id = get_device_id_from_entity_id(
             self.hass, self.config.runtime_data.core.mic_device
@@ -64,6 +68,10 @@ class ViewAssistSensor(SensorEntity):
 
     async def async_added_to_hass(self) -> None:
         """Run when entity is about to be added to hass."""
+        # Entity id is only known once added
+        self._background_update_event = VA_BACKGROUND_UPDATE_EVENT.format(
+            self.entity_id
+        )
         self.async_on_remove(
             async_dispatcher_connect(
                 self.hass,
@@ -85,10 +93,7 @@ class ViewAssistSensor(SensorEntity):
     # TODO: Remove this when BPs/Views migrated
     def get_option_key_migration_value(self, value: str) -> str:
         """Get the original option key for a given new option key."""
-        for key, key_value in OPTION_KEY_MIGRATIONS.items():
-            if key_value == value:
-                return key
-        return value
+        return OPTION_KEY_ORIGINALS.get(value, value)
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
@@ -162,15 +167,11 @@ class ViewAssistSensor(SensorEntity):
                 old_val = None
             if v != old_val:
                 kwargs = {"attribute": k, "old_value": old_val, "new_value": v}
-                self.hass.bus.fire(
-                    VA_ATTRIBUTE_UPDATE_EVENT.format(self.config.entry_id), kwargs
-                )
+                self.hass.bus.fire(self._attribute_update_event, kwargs)
 
                 # Fire background changed event to support linking device backgrounds
                 if k == "background":
-                    self.hass.bus.fire(
-                        VA_BACKGROUND_UPDATE_EVENT.format(self.entity_id), kwargs
-                    )
+                    self.hass.bus.fire(self._background_update_event, kwargs)
 
             # Set the value of named vartiables or add/update to extra_data dict
             if hasattr(self.config.runtime_data.default, k):
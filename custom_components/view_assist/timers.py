@@ -3,7 +3,7 @@
 import asyncio
 from collections.abc import Callable
 import contextlib
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 import datetime as dt
 from enum import StrEnum
 import inspect
@@ -86,7 +86,7 @@ VA_COMMAND_EVENT_PREFIX = "va_timer_command_{}"
 TIMERS = "timers"
 TIMERS_STORE_NAME = f"{DOMAIN}.{TIMERS}"
 
-WEEKDAYS = [
+WEEKDAYS = (
     "monday",
     "tuesday",
     "wednesday",
@@ -94,7 +94,9 @@ WEEKDAYS = [
     "friday",
     "saturday",
     "sunday",
-]
+)
+# monday is weekday 0
+WEEKDAY_NUMBERS = {weekday: i for i, weekday in enumerate(WEEKDAYS)}
 SPECIAL_DAYS = {
     "today": 0,
     "tomorrow": 1,
@@ -113,7 +115,7 @@ HOUR_FRACTIONS = {
     "3/4": 45,
     "three quarters": 45,
 }
-AMPM = ["am", "pm"]
+AMPM = ("am", "pm")
 SPECIAL_AMPM = {
     "morning": "am",
     "tonight": "pm",
@@ -121,6 +123,9 @@ SPECIAL_AMPM = {
     "evening": "pm",
 }
 
+# Word to value replacements applied to decoded time parts
+TIME_WORDS = SPECIAL_HOURS | HOUR_FRACTIONS | SPECIAL_AMPM
+
 DIRECT_REPLACE = {
     "a day": "1 day",
     "an hour": "1 hour",
@@ -136,7 +141,7 @@ class TimerClass(StrEnum):
     COMMAND = "command"
 
 
-@dataclass
+@dataclass(slots=True)
 class TimerInterval:
     """Timer Interval."""
 
@@ -146,7 +151,7 @@ class TimerInterval:
     seconds: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class TimerTime:
     """Timer Time."""
 
@@ -166,6 +171,11 @@ class TimerStatus(StrEnum):
     SNOOZED = "snoozed"
 
 
+# Lookups to restore enum members from stored values
+TIMER_CLASS_BY_VALUE = {member.value: member for member in TimerClass}
+TIMER_STATUS_BY_VALUE = {member.value: member for member in TimerStatus}
+
+
 class TimerEvent(StrEnum):
     """Event enums."""
 
@@ -189,14 +199,14 @@ class Timer:
     pre_expire_warning: int = 0
     created_at: int = 0
     updated_at: int = 0
-    status: TimerStatus = field(default_factory=TimerStatus.INACTIVE)
+    status: TimerStatus = TimerStatus.INACTIVE
     extra_info: dict[str, Any] | None = None
 
 
 REGEX_DAYS = (
     r"(?i)\b("
     + (
-        "|".join(WEEKDAYS + list(SPECIAL_DAYS))
+        "|".join((*WEEKDAYS, *SPECIAL_DAYS))
         + "|"
         + "|".join(f"Next {weekday}" for weekday in WEEKDAYS)
     )
@@ -210,16 +220,16 @@ REGEX_DAYS = (
 # Monday at 10:00 AM
 REGEX_TIME = (
     r"(?i)\b("
-    + ("|".join(WEEKDAYS + list(SPECIAL_DAYS)))
+    + ("|".join((*WEEKDAYS, *SPECIAL_DAYS)))
     + "|"
     + ("|".join([f"next {day}" for day in WEEKDAYS]))
     + r")?[ ]?(?:at)?[ ]?([01]?[0-9]|2[0-3]):?([0-5][0-9])(?::([0-9][0-9]))?[ ]?(?:this)?[ ]?("
-    + "|".join(AMPM + list(SPECIAL_AMPM))
+    + "|".join((*AMPM, *SPECIAL_AMPM))
     + r")?\b"
 )
 REGEX_ALT_TIME = (
     r"(?i)\b("
-    + ("|".join(WEEKDAYS + list(SPECIAL_DAYS)))
+    + ("|".join((*WEEKDAYS, *SPECIAL_DAYS)))
     + "|"
     + ("|".join([f"next {day}" for day in WEEKDAYS]))
     + r")?[ ]?(?:at)?[ ]?"
@@ -239,13 +249,13 @@ REGEX_ALT_TIME = (
 # 20 to 4:00 PM
 REGEX_SUPER_TIME = (
     r"(?i)\b(?P<day>"
-    + ("|".join(WEEKDAYS + list(SPECIAL_DAYS)))
+    + ("|".join((*WEEKDAYS, *SPECIAL_DAYS)))
     + r")?[ ]?(?:at)?[ ]?(\d+|"
     + "|".join(list(HOUR_FRACTIONS))
     + r")\s(to|past)\s(\d+|"
     + ("|".join(SPECIAL_HOURS))
     + r")(?::\d+)?[ ]?("
-    + "|".join(AMPM + list(SPECIAL_AMPM))
+    + "|".join((*AMPM, *SPECIAL_AMPM))
     + r")?\b"
 )
 
@@ -389,18 +399,13 @@ def decode_time_sentence(sentence: str):
                         decoded[0] = day_text[0].lower()
 
                 # If has special hours, set meridiem
-                if decoded[1] in list(SPECIAL_HOURS):
+                if decoded[1] in SPECIAL_HOURS:
                     decoded[4] = "am" if SPECIAL_HOURS[decoded[1]] < 12 else "pm"
 
                 # now iterate and replace text numbers with numbers
                 for i, v in enumerate(decoded):
                     if i > 0:
-                        with contextlib.suppress(KeyError):
-                            decoded[i] = SPECIAL_HOURS[v]
-                        with contextlib.suppress(KeyError):
-                            decoded[i] = HOUR_FRACTIONS[v]
-                        with contextlib.suppress(KeyError):
-                            decoded[i] = SPECIAL_AMPM[v]
+                        decoded[i] = TIME_WORDS.get(v, v)
 
                 # Make time objects
                 if is_interval:
@@ -452,10 +457,8 @@ def get_datetime_from_timer_time(
             has_next = True
             day = day.replace("next", "").strip()
 
-        if day in WEEKDAYS:
-            # monday is weekday 0
+        if (set_weekday := WEEKDAY_NUMBERS.get(day)) is not None:
             current_weekday = dt_now.weekday()
-            set_weekday = WEEKDAYS.index(day)
 
             # Check for 'next' prefix to day or if day less than today (assume next week)
             if set_weekday < current_weekday or has_next:
@@ -605,6 +608,12 @@ class VATimerStore:
         if stored:
             stored = await self.migrate(stored)
             for timer_id, timer in stored.items():
+                timer_class = timer["timer_class"]
+                timer["timer_class"] = TIMER_CLASS_BY_VALUE.get(
+                    timer_class, timer_class
+                )
+                if (status := timer.get("status")) is not None:
+                    timer["status"] = TIMER_STATUS_BY_VALUE.get(status, status)
                 self.timers[timer_id] = Timer(**timer)
         self.dirty = False
 
@@ -19,6 +19,10 @@ class VAType(StrEnum):
     AUDIO_ONLY = "audio_only"
 
 
+VAType.VALUES = tuple(e.value for e in VAType)
+VAType.NON_MASTER_VALUES = tuple(e.value for e in VAType if e != VAType.MASTER_CONFIG)
+
+
 class VATimeFormat(StrEnum):
     """Time format enum."""
 
@@ -26,6 +30,9 @@ class VATimeFormat(StrEnum):
     HOUR_24 = "hour_24"
 
 
+VATimeFormat.VALUES = tuple(e.value for e in VATimeFormat)
+
+
 class VAScreenMode(StrEnum):
     """Screen mode enum."""
 
@@ -35,6 +42,9 @@ class VAScreenMode(StrEnum):
     HIDE_HEADER_SIDEBAR = "hide_header_sidebar"
 
 
+VAScreenMode.VALUES = tuple(e.value for e in VAScreenMode)
+
+
 class VAAssistPrompt(StrEnum):
     """Assist prompt types enum."""
 
@@ -42,6 +52,9 @@ class VAAssistPrompt(StrEnum):
     FLASHING_BAR = "flashing_bar"
 
 
+VAAssistPrompt.VALUES = tuple(e.value for e in VAAssistPrompt)
+
+
 class VAIconSizes(StrEnum):
     """Icon size options enum."""
 
@@ -50,6 +63,9 @@ class VAIconSizes(StrEnum):
     LARGE = "8vw"
 
 
+VAIconSizes.VALUES = tuple(e.value for e in VAIconSizes)
+
+
 class VADisplayType(StrEnum):
     """Display types."""
 
@@ -67,6 +83,12 @@ class VABackgroundMode(StrEnum):
     LINKED = "link_to_entity"
 
 
+VABackgroundMode.VALUES = tuple(e.value for e in VABackgroundMode)
+VABackgroundMode.NON_LINKED_VALUES = tuple(
+    e.value for e in VABackgroundMode if e != VABackgroundMode.LINKED
+)
+
+
 class VAMenuConfig(StrEnum):
     """Menu configuration options enum."""
 
@@ -75,6 +97,9 @@ class VAMenuConfig(StrEnum):
     ENABLED_HIDDEN = "menu_enabled_button_hidden"
 
 
+VAMenuConfig.VALUES = tuple(e.value for e in VAMenuConfig)
+
+
 @dataclass
 class IntegrationConfig:
     """Class to hold integration config data."""
@@ -156,29 +181,27 @@ class DeveloperConfig:
     developer_mimic_device: str | None = None
 
 
+@dataclass(slots=True)
 class MasterConfigRuntimeData:
     """Class to hold master config data."""
 
-    def __init__(self) -> None:
-        """Initialize runtime data."""
-        self.integration: IntegrationConfig = IntegrationConfig()
-        self.dashboard: DashboardConfig = DashboardConfig()
-        self.default: DefaultConfig = DefaultConfig()
-        self.developer_settings: DeveloperConfig = DeveloperConfig()
-        # Extra data for holding key/value pairs passed in by set_state service call
-        self.extra_data: dict[str, Any] = {}
+    integration: IntegrationConfig = field(default_factory=IntegrationConfig)
+    dashboard: DashboardConfig = field(default_factory=DashboardConfig)
+    default: DefaultConfig = field(default_factory=DefaultConfig)
+    developer_settings: DeveloperConfig = field(default_factory=DeveloperConfig)
+    # Extra data for holding key/value pairs passed in by set_state service call
+    extra_data: dict[str, Any] = field(default_factory=dict)
 
 
+@dataclass(slots=True)
 class DeviceRuntimeData:
     """Class to hold runtime data."""
 
-    def __init__(self) -> None:
-        """Initialize runtime data."""
-        self.core: DeviceCoreConfig = DeviceCoreConfig()
-        self.dashboard: DashboardConfig = DashboardConfig()
-        self.default: DefaultConfig = DefaultConfig()
-        # Extra data for holding key/value pairs passed in by set_state service call
-        self.extra_data: dict[str, Any] = {}
+    core: DeviceCoreConfig = field(default_factory=DeviceCoreConfig)
+    dashboard: DashboardConfig = field(default_factory=DashboardConfig)
+    default: DefaultConfig = field(default_factory=DefaultConfig)
+    # Extra data for holding key/value pairs passed in by set_state service call
+    extra_data: dict[str, Any] = field(default_factory=dict)
 
 
 @dataclass